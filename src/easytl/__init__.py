@@ -6,6 +6,17 @@ from .version import VERSION as __version__  # noqa
 
 __author__ = "Kaden Bilyeu (Bikatr7) <Bikatr7@proton.me>"
 
+import os
+
+## uvloop is an optional drop-in replacement for the default asyncio event loop that noticeably speeds up the *_translate_async fan-outs
+## installed automatically when the package is available, set EASYTL_USE_UVLOOP=0 to keep the standard loop
+if(os.environ.get("EASYTL_USE_UVLOOP", "1") != "0"):
+    try:
+        import uvloop # type: ignore
+        uvloop.install()
+    except ImportError:
+        pass
+
 from .easytl import EasyTL
 
 from .classes import Language, SplitSentences, Formality, GlossaryInfo, TextResult
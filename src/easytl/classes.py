@@ -34,6 +34,9 @@ class Message:
 
     """
 
+    ## slotted, large batches allocate one of these per input string so the per-instance __dict__ is worth dropping
+    __slots__ = ("_content",)
+
     def __init__(self, content: str):
         self._content = content
 
@@ -67,6 +70,8 @@ class SystemTranslationMessage(Message):
 
     """
 
+    __slots__ = ()
+
     @property
     def role(self):
         return 'system'
@@ -78,9 +83,11 @@ class ModelTranslationMessage(Message):
     """
 
     ModelTranslationMessage is a class that is used to send the model/user message to the OpenAI API.
-    
+
     """
-    
+
+    __slots__ = ()
+
     @property
     def role(self):
         return 'user'
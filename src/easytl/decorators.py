@@ -7,12 +7,63 @@
 ## built-in libraries
 from functools import wraps
 
+import atexit
 import datetime
 import os
+import queue
+import threading
 
 ## custom modules
 from .classes import AnthropicTextBlock, AnthropicToolUseBlock
 
+##-------------------start-of-log write queue---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+## log writes go through a single background thread, so translations never block on disk I/O in the hot path (which would re-serialize the parallel paths)
+_log_write_queue:queue.SimpleQueue = queue.SimpleQueue()
+_log_writer_thread:threading.Thread | None = None
+_log_writer_lock = threading.Lock()
+
+def _log_writer():
+
+    while(True):
+        _item = _log_write_queue.get()
+
+        ## None is the shutdown sentinel, enqueued by _flush_log_writes() at interpreter exit
+        if(_item is None):
+            break
+
+        _filepath, _log_data = _item
+
+        try:
+            with open(_filepath, 'a+') as file:
+                file.write(_log_data)
+
+        except OSError:
+            ## a failed log write shouldn't take the translation down with it
+            pass
+
+def _flush_log_writes():
+
+    if(_log_writer_thread is None):
+        return
+
+    _log_write_queue.put(None)
+    _log_writer_thread.join(timeout=5)
+
+def _enqueue_log_write(filepath:str, log_data:str) -> None:
+
+    global _log_writer_thread
+
+    ## the writer thread is started lazily on the first logged call, double-checked so the lock is only taken once
+    if(_log_writer_thread is None):
+        with _log_writer_lock:
+            if(_log_writer_thread is None):
+                _log_writer_thread = threading.Thread(target=_log_writer, daemon=True)
+                _log_writer_thread.start()
+                atexit.register(_flush_log_writes)
+
+    _log_write_queue.put((filepath, log_data))
+
 ##-------------------start-of-get_nested_attribute()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
 def _get_nested_attribute(obj, attrs):
@@ -91,8 +142,7 @@ Timestamp: {timestamp}
 {'=' * 40}
         """
         
-        with open(filepath, 'a+') as file:
-            file.write(log_data)
+        _enqueue_log_write(filepath, log_data)
         
         return result
     
@@ -154,8 +204,7 @@ Timestamp: {timestamp}
 {'=' * 40}
         """
         
-        with open(filepath, 'a+') as file:
-            file.write(log_data)
+        _enqueue_log_write(filepath, log_data)
         
         return result
     
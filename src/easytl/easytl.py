@@ -5,6 +5,14 @@
 ## built-in libraries
 import typing
 import asyncio
+import re
+import sys
+import threading
+import time
+from collections import namedtuple
+from functools import partial
+
+from concurrent.futures import ThreadPoolExecutor
 
 import warnings
 
@@ -23,7 +31,148 @@ from. classes import ModelTranslationMessage, SystemTranslationMessage, TextResu
 from .exceptions import DeepLException, GoogleAPIError, OpenAIError, InvalidAPITypeException, InvalidResponseFormatException, InvalidTextInputException, EasyTLException, AnthropicError, RequestException
 
 from .util.util import _is_iterable_of_strings
-from .util.llm_util import _validate_easytl_llm_translation_settings, _return_curated_gemini_settings, _return_curated_openai_settings, _validate_stop_sequences, _validate_response_schema,  _return_curated_anthropic_settings, _validate_text_length 
+from .util.llm_util import _validate_easytl_llm_translation_settings, _return_curated_gemini_settings, _return_curated_openai_settings, _validate_stop_sequences, _validate_response_schema,  _return_curated_anthropic_settings, _validate_text_length, _get_encoding
+
+## How long a successful credential validation is trusted for, in seconds.
+## Every translate function calls test_credentials(), which performs a live API round-trip, so without a cache batch workloads pay that round-trip on every single call.
+## valid response_type values per API family, frozensets make the per-call membership check a hash lookup instead of a list scan
+_TEXT_RAW_RESPONSE_TYPES = frozenset({"text", "raw"})
+_LLM_RESPONSE_TYPES = frozenset({"text", "raw", "json", "raw_json"})
+_AZURE_RESPONSE_TYPES = frozenset({"text", "json"})
+_TEXT_FORMATS = frozenset({"text", "html"})
+_RAW_TYPES = frozenset({"raw", "raw_json"})
+_JSON_TYPES = frozenset({"json", "raw_json"})
+_TEXT_TYPES = frozenset({"text", "json"})
+
+## how many strings go into one batched DeepL request, large enough to amortize the round-trip without tripping request-size limits
+_DEEPL_BATCH_SIZE:int = 50
+
+## how many strings go into one batched Azure request, the /translate endpoint caps the array at 100 entries
+_AZURE_BATCH_SIZE:int = 100
+
+## how many strings go into one batched Google Translate request, the v2 API caps a request at 128 segments
+_GOOGLETL_BATCH_SIZE:int = 128
+
+## shared message for the malformed-response checks scattered across the translate functions, one interned literal instead of a copy per call site
+_MALFORMED_RESPONSE_MSG:str = "Malformed response received. Please try again."
+
+_CREDENTIAL_VALIDATION_TTL:float = 300.0
+
+## api_type -> monotonic timestamp of the last successful validation
+_validated_credentials:typing.Dict[str, float] = {}
+_validated_credentials_lock = threading.Lock()
+
+## Dispatch tables for set_credentials()/test_credentials(), built once at import instead of rebuilding a dict on every call.
+_SET_CREDENTIALS_DISPATCH = {
+    "deepl": DeepLService._set_api_key,
+    "gemini": GeminiService._set_api_key,
+    "openai": OpenAIService._set_api_key,
+    "google translate": GoogleTLService._set_credentials,
+    "anthropic": AnthropicService._set_api_key,
+    "azure": AzureService._set_api_key
+}
+
+async def _gather_translations(_coroutines:typing.List) -> typing.List:
+
+    """
+
+    Runs the given translation coroutines concurrently and returns their results in order.
+
+    On Python 3.11+ this uses asyncio.TaskGroup, which has lower per-task overhead than gather and cancels the remaining requests as soon as one of them fails instead of leaking them. Older interpreters fall back to asyncio.gather.
+
+    """
+
+    if(sys.version_info >= (3, 11)):
+        try:
+            async with asyncio.TaskGroup() as _tg:
+                _tasks = [_tg.create_task(_coroutine) for _coroutine in _coroutines]
+
+        except ExceptionGroup as _eg:
+
+            ## a single failure is re-raised bare, so callers' except clauses for the provider exceptions keep matching and the behavior stays in line with the gather fallback below
+            if(len(_eg.exceptions) == 1):
+                raise _eg.exceptions[0] from None
+
+            raise
+
+        return [_task.result() for _task in _tasks]
+
+    return list(await asyncio.gather(*_coroutines))
+
+## a namedtuple instead of a nested dict, so each lookup is one string-keyed access plus cheap attribute reads
+_ApiService = namedtuple("_ApiService", ["service", "exception", "test_func"])
+
+_TEST_CREDENTIALS_DISPATCH = {
+    "deepl": _ApiService(DeepLService, DeepLException, DeepLService._test_api_key_validity),
+    "gemini": _ApiService(GeminiService, GoogleAPIError, GeminiService._test_api_key_validity),
+    "openai": _ApiService(OpenAIService, OpenAIError, OpenAIService._test_api_key_validity),
+    "google translate": _ApiService(GoogleTLService, GoogleAPIError, GoogleTLService._test_credentials),
+    "anthropic": _ApiService(AnthropicService, AnthropicError, AnthropicService._test_api_key_validity),
+    "azure": _ApiService(AzureService, RequestException, AzureService._test_credentials)
+}
+
+## one probe lock per api type, concurrent first calls from multiple threads then share a single live validation instead of each paying the round-trip
+_credential_probe_locks = {_api_type: threading.Lock() for _api_type in _TEST_CREDENTIALS_DISPATCH}
+
+##-------------------start-of-packed batch helpers---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+## marker format for the opt-in packed-batch mode, one numbered marker per segment so the response can be split back apart
+_BATCH_MARKER = "<<<{}>>>"
+_BATCH_SPLIT_PATTERN = re.compile(r"<<<\d+>>>")
+
+## appended to the caller's instructions so the model keeps the markers intact
+_PACKED_BATCH_INSTRUCTIONS = (" The input contains multiple numbered segments, each preceded by a <<<N>>> marker."
+                              " Translate every segment separately and reproduce each marker verbatim, on its own line, before its translated segment.")
+
+def _pack_texts(_texts:typing.Sequence[str]) -> str:
+
+    """
+
+    Joins several input strings into one prompt body, each prefixed with its numbered marker.
+
+    Parameters:
+    _texts (sequence of strings) : The strings to pack.
+
+    Returns:
+    packed (string) : The packed prompt body.
+
+    """
+
+    return "\n".join(_BATCH_MARKER.format(_i + 1) + "\n" + _t for _i, _t in enumerate(_texts))
+
+def _unpack_packed_response(_response:str, _expected:int) -> typing.List[str]:
+
+    """
+
+    Splits a packed-batch response back into its translated segments.
+
+    Parameters:
+    _response (string) : The model's response to a packed prompt.
+    _expected (int) : The number of segments the prompt contained.
+
+    Returns:
+    segments (list of strings) : The translated segments, in input order.
+
+    """
+
+    _segments = [_s.strip() for _s in _BATCH_SPLIT_PATTERN.split(_response)]
+
+    ## anything before the first marker is preamble (usually the empty string, since the response is told to open with <<<1>>>), drop it unconditionally
+    ## dropping it only when the count looked one-too-high let a response with a missing segment slip through, the empty preamble piece stood in for the lost segment and shifted every later translation onto the wrong input
+    _segments = _segments[1:]
+
+    if(len(_segments) != _expected):
+        raise EasyTLException(f"Packed batch response contained {len(_segments)} segments, expected {_expected}. Retry with batch_size=1 for this input.")
+
+    return _segments
+
+## content projections shared by the hot extraction paths, compiled once at import instead of rebuilt as a closure on every call
+## (operator.attrgetter would be marginally faster still, but it can't express the [0] subscript in the middle of either chain)
+_get_openai_text = lambda _r: _r.choices[0].message.content
+_get_anthropic_text = lambda _r: _r.content[0].text
+
+## same idea for Azure's raw JSON shape, one entry per input each holding a translations list
+_get_azure_text = lambda _r: _r[0]['translations'][0]['text']
 
 class EasyTL:
 
@@ -58,19 +207,15 @@ class EasyTL:
 
         """
 
-        service_map = {
-            "deepl": DeepLService._set_api_key,
-            "gemini": GeminiService._set_api_key,
-            "openai": OpenAIService._set_api_key,
-            "google translate": GoogleTLService._set_credentials,
-            "anthropic": AnthropicService._set_api_key,
-            "azure": AzureService._set_api_key
+        ## an explicit raise instead of an assert, since asserts are stripped under python -O
+        if(api_type not in _SET_CREDENTIALS_DISPATCH):
+            raise InvalidAPITypeException("Invalid API type specified. Supported types are 'deepl', 'gemini', 'openai', 'google translate', 'anthropic' and 'azure'.")
 
-        }
+        ## new credentials invalidate any cached validation for this api type
+        with _validated_credentials_lock:
+            _validated_credentials.pop(api_type, None)
 
-        assert api_type in service_map, InvalidAPITypeException("Invalid API type specified. Supported types are 'deepl', 'gemini', 'openai', 'google translate', 'anthropic' and 'azure'.")
-
-        service_map[api_type](credentials)
+        _SET_CREDENTIALS_DISPATCH[api_type](credentials)
 
 ##-------------------start-of-test_credentials()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -90,26 +235,119 @@ class EasyTL:
 
         """
 
-        api_services = {
-            "deepl": {"service": DeepLService, "exception": DeepLException, "test_func": DeepLService._test_api_key_validity},
-            "gemini": {"service": GeminiService, "exception": GoogleAPIError, "test_func": GeminiService._test_api_key_validity},
-            "openai": {"service": OpenAIService, "exception": OpenAIError, "test_func": OpenAIService._test_api_key_validity},
-            "google translate": {"service": GoogleTLService, "exception": GoogleAPIError, "test_func": GoogleTLService._test_credentials},
-            "anthropic": {"service": AnthropicService, "exception": AnthropicError, "test_func": AnthropicService._test_api_key_validity},
-            "azure": {"service": AzureService, "exception": RequestException, "test_func": AzureService._test_credentials}
-        }
+        ## an explicit raise instead of an assert, since asserts are stripped under python -O
+        if(api_type not in _TEST_CREDENTIALS_DISPATCH):
+            raise InvalidAPITypeException("Invalid API type specified. Supported types are 'deepl', 'gemini', 'openai', 'google translate', 'anthropic' and 'azure'.")
 
-        assert api_type in api_services, InvalidAPITypeException("Invalid API type specified. Supported types are 'deepl', 'gemini', 'openai', 'google translate', 'anthropic' and 'azure'.")
+        ## skip the live round-trip if these credentials were validated recently, this is invalidated by set_credentials()
+        with _validated_credentials_lock:
+            _last_validated = _validated_credentials.get(api_type)
 
-        _is_valid, _e = api_services[api_type]["test_func"]()
+        if(_last_validated is not None and time.monotonic() - _last_validated < _CREDENTIAL_VALIDATION_TTL):
+            return True, None
 
-        if(not _is_valid):
-            ## Done to make sure the exception is due to the specified API type and not the fault of EasyTL
-            assert isinstance(_e, api_services[api_type]["exception"]), _e
-            return False, _e
+        ## serialize the probe itself, the re-check means threads that queued behind a successful probe return from the cache instead of probing again
+        with _credential_probe_locks[api_type]:
+
+            with _validated_credentials_lock:
+                _last_validated = _validated_credentials.get(api_type)
+
+            if(_last_validated is not None and time.monotonic() - _last_validated < _CREDENTIAL_VALIDATION_TTL):
+                return True, None
+
+            _api_service = _TEST_CREDENTIALS_DISPATCH[api_type]
+
+            _is_valid, _e = _api_service.test_func()
+
+            if(not _is_valid):
+                ## Done to make sure the exception is due to the specified API type and not the fault of EasyTL
+                if(not isinstance(_e, _api_service.exception)):
+                    raise _e ## type: ignore
+                return False, _e
+
+            with _validated_credentials_lock:
+                _validated_credentials[api_type] = time.monotonic()
+
+            return True, None
+
+##-------------------start-of-use_uvloop()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def use_uvloop() -> None:
+
+        """
+
+        Installs uvloop as the asyncio event-loop policy, which speeds up the *_translate_async fan-outs.
+
+        This happens automatically on import when uvloop is installed; call this only if you opted out via EASYTL_USE_UVLOOP=0 and want it back for the current process.
+
+        Raises ImportError if uvloop is not installed, it is an optional dependency.
+
+        """
+
+        import uvloop # type: ignore
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+##-------------------start-of-warmup()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def warmup(services:typing.Iterable[str] = ("openai", "anthropic")) -> None:
+
+        """
+
+        Pre-warms the given services so the first translate call doesn't pay the cold-start cost.
+
+        Loads the tokenizer used by input-length validation and runs the credential probe for each service, which establishes the pooled HTTP connection and primes the validation cache for its TTL window.
+
+        Useful for short-lived CLI invocations and serverless deployments where first-call latency matters. Credentials must already be set for every service listed.
+
+        Parameters:
+        services (iterable of strings) : The services to warm up. Must be 'deepl', 'google translate', 'gemini', 'openai', 'anthropic' or 'azure'.
+
+        """
+
+        ## the encoder tiktoken builds is the one length validation falls back to for every non-OpenAI LLM, loading it here keeps the multi-second first build out of the first translate call
+        if(any(_service in ("openai", "gemini", "anthropic") for _service in services)):
+            _get_encoding("gpt-4-turbo-2024-04-09")
+
+        for _service in services:
+            EasyTL.test_credentials(_service)
+
+##-------------------start-of-aclose()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    async def aclose() -> None:
+
+        """
+
+        Closes the pooled HTTP connections EasyTL holds open for async translation.
+
+        Optional, but long-running applications should call this at shutdown so keep-alive connections are torn down cleanly instead of being dropped.
+
+        """
+
+        _client = AzureService._async_clients.pop(asyncio.get_running_loop(), None)
+
+        if(_client is not None):
+            await _client.aclose()
+
+##-------------------start-of-clear_cache()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def clear_cache() -> None:
+
+        """
+
+        Clears the in-process translation result cache.
+
+        The Azure paths cache responses across calls unconditionally; the Gemini paths do so at temperature 0, where identical inputs are guaranteed identical outputs. Strings already translated this process are served from these caches without a network round-trip.
+
+        """
+
+        AzureService._translation_cache.clear()
+        GeminiService._translation_cache.clear()
 
-        return True, None
-    
 ##-------------------start-of-googletl_translate()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -119,6 +357,7 @@ class EasyTL:
                            decorator:typing.Callable | None = None,
                            logging_directory:str | None = None,
                            response_type:typing.Literal["text", "raw"] | None = "text",
+                           concurrency:int | None = 15,
                            translation_delay:float | None = None,
                            format:typing.Literal["text", "html"] = "text",
                            source_lang:str | None = None) -> typing.Union[typing.List[str], str, typing.List[typing.Any], typing.Any]:
@@ -140,6 +379,7 @@ class EasyTL:
         decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
         response_type (literal["text", "raw"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response.
+        concurrency (int) : If text is an iterable, the number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
         format (string or None) : The format of the text. Can be 'text' or 'html'. Default is 'text'. Google Translate appears to be able to translate html but this has not been tested thoroughly by EasyTL.
         source_lang (string or None) : The source language to translate from.
@@ -149,9 +389,11 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
 
-        assert format in ["text", "html"], InvalidResponseFormatException("Invalid format specified. Must be 'text' or 'html'.")
+        if(format not in _TEXT_FORMATS):
+            raise InvalidResponseFormatException("Invalid format specified. Must be 'text' or 'html'.")
 
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("google translate")
@@ -165,32 +407,62 @@ class EasyTL:
                                             semaphore=None, 
                                             rate_limit_delay=translation_delay)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = GoogleTLService._decorated_translate_text or GoogleTLService._translate_text
 
-        def translate(text):
-            return GoogleTLService._translate_text(text)
-        
-        if(decorator is not None):
-            translate = GoogleTLService._decorator_to_use(GoogleTLService._translate_text) ## type: ignore
+        ## response_type is fixed for the whole call, so the projection over the results is picked once here rather than per element
+        _finalize = (lambda _rs: [_r["translatedText"] for _r in _rs]) if response_type == "text" else (lambda _rs: _rs)
+
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
 
-        else:
-            translate = GoogleTLService._translate_text
-            
         if(isinstance(text, str)):
+
+            ## blank input translates to itself, don't pay a round-trip for it
+            if(response_type == "text" and not text.strip()):
+                return text
+
             result = translate(text)
-        
-            assert not isinstance(result, list), EasyTLException("Malformed response received. Please try again.")
+
+            if(isinstance(result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
             result = result if response_type == "raw" else result["translatedText"]
-        
+
         elif(_is_iterable_of_strings(text)):
 
-            results = [translate(t) for t in text]
+            ## duplicate strings only pay for one API call each, results are fanned back out over the original input afterwards
+            _unique = list(dict.fromkeys(text))
 
-            assert isinstance(results, list), EasyTLException("Malformed response received. Please try again.")
+            ## blank strings have nothing to translate, so in text mode they skip the network and map to themselves (raw callers expect a response object per input, so those still go out)
+            _skipped = {}
 
-            result = [r["translatedText"] for r in results] if response_type == "text" else results # type: ignore
+            if(response_type == "text"):
+                _skipped = {_t: _t for _t in _unique if not _t.strip()}
+                _unique = [_t for _t in _unique if _t.strip()]
+
+            ## Google Translate v2 accepts arrays of up to 128 strings, so the iterable goes out as a few batched requests instead of N round-trips.
+            ## A translation_delay or logging_directory implies per-call pacing/logging, so those fall back to one request per element via a thread pool.
+            if(not _unique):
+                _unique_results = []
+
+            elif(translation_delay is None and logging_directory is None):
+                _chunks = [_unique[_i:_i + _GOOGLETL_BATCH_SIZE] for _i in range(0, len(_unique), _GOOGLETL_BATCH_SIZE)]
+                _unique_results = [_r for _chunk in _chunks for _r in translate(_chunk)]
+
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as _executor:
+                    _unique_results = list(_executor.map(translate, _unique))
+
+            if(not (isinstance(_unique_results, list))):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            ## the projection only depends on response_type, applying it to the unique results here means duplicates don't pay for it twice
+            _result_map = dict(zip(_unique, _finalize(_unique_results)))
+            _result_map.update(_skipped)
+
+            result = [_result_map[t] for t in text]
             
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
@@ -208,6 +480,7 @@ class EasyTL:
                                        response_type:typing.Literal["text", "raw"] | None = "text",
                                        semaphore:int | None = 15,
                                        translation_delay:float | None = None,
+                                       translation_delay_burst:int = 1,
                                        format:typing.Literal["text", "html"] = "text",
                                        source_lang:str | None = None) -> typing.Union[typing.List[str], str, typing.List[typing.Any], typing.Any]:
         
@@ -233,6 +506,7 @@ class EasyTL:
         response_type (literal["text", "raw"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response.
         semaphore (int) : The number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
         format (string or None) : The format of the text. Can be 'text' or 'html'. Default is 'text'. Google Translate appears to be able to translate html but this has not been tested thoroughly by EasyTL.
         source_lang (string or None) : The source language to translate from.
 
@@ -241,9 +515,11 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
 
-        assert format in ["text", "html"], InvalidResponseFormatException("Invalid format specified. Must be 'text' or 'html'.")
+        if(format not in _TEXT_FORMATS):
+            raise InvalidResponseFormatException("Invalid format specified. Must be 'text' or 'html'.")
 
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("google translate")
@@ -255,39 +531,181 @@ class EasyTL:
                                             decorator=decorator, 
                                             logging_directory=logging_directory, 
                                             semaphore=semaphore, 
-                                            rate_limit_delay=translation_delay)
+                                            rate_limit_delay=translation_delay,
+                                            rate_limit_burst=translation_delay_burst)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
-        def translate(text):
-            return GoogleTLService._translate_text_async(text)
-        
-        if(decorator is not None):
-            translate = GoogleTLService._decorator_to_use(GoogleTLService._translate_text_async) ## type: ignore
-
-        else:
-            translate = GoogleTLService._translate_text_async
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = GoogleTLService._decorated_translate_text_async or GoogleTLService._translate_text_async
             
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         if(isinstance(text, str)):
+
+            ## blank input translates to itself, don't pay a round-trip for it
+            if(response_type == "text" and not text.strip()):
+                return text
+
             _result = await translate(text)
 
-            assert not isinstance(_result, list), EasyTLException("Malformed response received. Please try again.")
+            if(isinstance(_result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
             result = _result if response_type == "raw" else _result["translatedText"]
             
         elif(_is_iterable_of_strings(text)):
-            _tasks = [translate(t) for t in text]
-            _results = await asyncio.gather(*_tasks)
-            
-            assert isinstance(_results, list), EasyTLException("Malformed response received. Please try again.")
 
-            result = [_r["translatedText"] for _r in _results] if response_type == "text" else _results # type: ignore
+            ## duplicate strings only pay for one API call each, results are fanned back out over the original input afterwards
+            _unique = list(dict.fromkeys(text))
+
+            ## cap the number of in-flight requests at the entry point, so huge iterables don't spawn one coroutine per element all at once
+            _sem = asyncio.Semaphore(semaphore or 15)
+
+            async def _bounded_translate(t):
+                async with _sem:
+                    return await translate(t)
+
+            if(response_type == "text"):
+
+                ## blank strings have nothing to translate, so they skip the network and map to themselves
+                _skipped = {_t: _t for _t in _unique if not _t.strip()}
+                _unique = [_t for _t in _unique if _t.strip()]
+
+                ## raw responses carry metadata (detected source language etc.), so for text responses each one is projected down to its translated string as it completes, instead of holding every raw response in memory until the gather finishes
+                async def _indexed_translate(i, t):
+                    async with _sem:
+                        return i, await translate(t)
+
+                _translated_unique:typing.List[str] = [""] * len(_unique)
+
+                for _future in asyncio.as_completed([_indexed_translate(_i, _t) for _i, _t in enumerate(_unique)]):
+                    _i, _r = await _future
+                    _translated_unique[_i] = _r["translatedText"]
+
+                _result_map = dict(zip(_unique, _translated_unique))
+                _result_map.update(_skipped)
+
+                result = [_result_map[t] for t in text]
+
+            else:
+                _unique_results = await _gather_translations([_bounded_translate(t) for t in _unique])
+
+                if(not (isinstance(_unique_results, list))):
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                _result_map = dict(zip(_unique, _unique_results))
+                result = [_result_map[t] for t in text]
                 
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
-        
+
         return result
-    
+
+##-------------------start-of-googletl_translate_iter()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    async def googletl_translate_iter(text:typing.Iterable[str],
+                                      target_lang:str = "en",
+                                      override_previous_settings:bool = True,
+                                      decorator:typing.Callable | None = None,
+                                      logging_directory:str | None = None,
+                                      response_type:typing.Literal["text", "raw"] | None = "text",
+                                      semaphore:int | None = 15,
+                                      translation_delay:float | None = None,
+                                      translation_delay_burst:int = 1,
+                                      format:typing.Literal["text", "html"] = "text",
+                                      source_lang:str | None = None) -> typing.AsyncIterator[typing.Union[str, typing.Any]]:
+
+        """
+
+        Streaming version of googletl_translate_async().
+
+        Yields each translation as soon as it completes instead of collecting them all into a list first, so at most `semaphore` requests and results are held in memory at any time. This makes it suitable for very large or unbounded iterables, which are consumed lazily.
+
+        Results are NOT guaranteed to arrive in input order. Use googletl_translate_async() if order matters.
+
+        This function assumes that the credentials have already been set.
+
+        Parameters:
+        text (iterable) : The texts to translate. Consumed lazily, so generators are fine.
+        target_lang (string) : The target language to translate to.
+        override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to a Google Translate function.
+        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
+        logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
+        response_type (literal["text", "raw"]) : The type of response to yield. 'text' yields the translated text, 'raw' yields the raw response.
+        semaphore (int) : The number of concurrent requests to make. Default is 15.
+        translation_delay (float or None) : The delay between each translation. Default is none.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        format (string or None) : The format of the text. Can be 'text' or 'html'. Default is 'text'.
+        source_lang (string or None) : The source language to translate from.
+
+        Yields:
+        result (string or any) : Each translation result as it completes. A string if the response type is 'text', a raw response object otherwise.
+
+        """
+
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+
+        if(format not in _TEXT_FORMATS):
+            raise InvalidResponseFormatException("Invalid format specified. Must be 'text' or 'html'.")
+
+        if(isinstance(text, str)):
+            raise InvalidTextInputException("text must be an iterable of strings.")
+
+        ## Should be done after validating the settings to reduce cost to the user
+        EasyTL.test_credentials("google translate")
+
+        if(override_previous_settings == True):
+            GoogleTLService._set_attributes(target_language=target_lang,
+                                            format=format,
+                                            source_language=source_lang,
+                                            decorator=decorator,
+                                            logging_directory=logging_directory,
+                                            semaphore=semaphore,
+                                            rate_limit_delay=translation_delay,
+                                            rate_limit_burst=translation_delay_burst)
+
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = GoogleTLService._decorated_translate_text_async or GoogleTLService._translate_text_async
+
+        _window_size = semaphore or 15
+        _iterator = iter(text)
+        _pending:typing.Set[asyncio.Task] = set()
+        _exhausted = False
+
+        ## sliding window, a constant number of requests stays in flight and the next input is only pulled off the iterator when a slot frees up
+        try:
+            while(_pending or not _exhausted):
+
+                while(not _exhausted and len(_pending) < _window_size):
+
+                    try:
+                        _t = next(_iterator)
+
+                    except StopIteration:
+                        _exhausted = True
+                        break
+
+                    if(not isinstance(_t, str)):
+                        raise InvalidTextInputException("text must be an iterable of strings.")
+
+                    _pending.add(asyncio.ensure_future(translate(_t)))
+
+                if(not _pending):
+                    break
+
+                _done, _pending = await asyncio.wait(_pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for _task in _done:
+                    _result = _task.result()
+                    yield _result if response_type == "raw" else _result["translatedText"]
+
+        finally:
+            for _task in _pending:
+                _task.cancel()
+
 ##-------------------start-of-deepl_translate()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -297,6 +715,7 @@ class EasyTL:
                         decorator:typing.Callable | None = None,
                         logging_directory:str | None = None,
                         response_type:typing.Literal["text", "raw"] | None = "text",
+                        concurrency:int | None = 15,
                         translation_delay:float | None = None,
                         source_lang:str | Language | None = None,
                         context:str | None = None,
@@ -323,6 +742,7 @@ class EasyTL:
         decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying. If this parameter is None, DeepL will retry your request 5 times before failing. Otherwise, the given decorator will be used.
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
         response_type (literal["text", "raw"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, a TextResult object.
+        concurrency (int) : If text is an iterable, the number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
         source_lang (string or Language or None) : The source language to translate from.
         context (string or None) : Additional information for the translator to be considered when translating. Not translated itself. This is a DeepL alpha feature and may be removed at any time.
@@ -341,12 +761,13 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
 
         EasyTL.test_credentials("deepl")
 
         if(override_previous_settings == True):
-            DeepLService._set_attributes(target_lang = target_lang, 
+            DeepLService._set_attributes(target_lang = target_lang,
                                         source_lang = source_lang, 
                                         context = context, 
                                         split_sentences = split_sentences,
@@ -363,31 +784,62 @@ class EasyTL:
                                         semaphore=None,
                                         rate_limit_delay=translation_delay)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
-        def translate(text):
-            return DeepLService._translate_text(text)
-        
-        if(decorator is not None):
-            translate = DeepLService._decorator_to_use(DeepLService._translate_text) ## type: ignore
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = DeepLService._decorated_translate_text or DeepLService._translate_text
 
-        else:
-            translate = DeepLService._translate_text
+        ## response_type is fixed for the whole call, so the projection over the results is picked once here rather than per element
+        _finalize = (lambda _rs: [_r.text for _r in _rs]) if response_type == "text" else (lambda _rs: _rs)
+
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
 
         if(isinstance(text, str)):
+
+            ## blank input translates to itself, don't pay a round-trip for it
+            if(response_type == "text" and not text.strip()):
+                return text
+
             result = translate(text)
-        
-            assert not isinstance(result, list), EasyTLException("Malformed response received. Please try again.")
+
+            if(isinstance(result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
             result = result if response_type == "raw" else result.text
-        
+
         elif(_is_iterable_of_strings(text)):
 
-            results = [translate(t) for t in text]
+            ## duplicate strings only pay for one API call each, results are fanned back out over the original input afterwards
+            _unique = list(dict.fromkeys(text))
+
+            ## blank strings have nothing to translate, so in text mode they skip the network and map to themselves (raw callers expect a response object per input, so those still go out)
+            _skipped = {}
+
+            if(response_type == "text"):
+                _skipped = {_t: _t for _t in _unique if not _t.strip()}
+                _unique = [_t for _t in _unique if _t.strip()]
+
+            ## DeepL accepts arrays of strings, so the iterable can go out as a few chunked requests instead of N round-trips.
+            ## A translation_delay or logging_directory implies per-call pacing/logging, so those fall back to one request per element via a thread pool.
+            if(not _unique):
+                _unique_results = []
 
-            assert isinstance(results, list), EasyTLException("Malformed response received. Please try again.")
+            elif(translation_delay is None and logging_directory is None):
+                _chunks = [_unique[_i:_i + _DEEPL_BATCH_SIZE] for _i in range(0, len(_unique), _DEEPL_BATCH_SIZE)]
+                _unique_results = [_r for _chunk in _chunks for _r in translate(_chunk)]
 
-            result = [_r.text for _r in results] if response_type == "text" else results # type: ignore    
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as _executor:
+                    _unique_results = list(_executor.map(translate, _unique))
+
+            if(not (isinstance(_unique_results, list))):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            ## the projection only depends on response_type, applying it to the unique results here means duplicates don't pay for it twice
+            _result_map = dict(zip(_unique, _finalize(_unique_results)))
+            _result_map.update(_skipped)
+
+            result = [_result_map[t] for t in text]
             
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
@@ -405,6 +857,7 @@ class EasyTL:
                             response_type:typing.Literal["text", "raw"] | None = "text",
                             semaphore:int | None = 15,
                             translation_delay:float | None = None,
+                            translation_delay_burst:int = 1,
                             source_lang:str | Language | None = None,
                             context:str | None = None,
                             split_sentences:typing.Literal["OFF", "ALL", "NO_NEWLINES"] |  SplitSentences | None = "ALL",
@@ -436,6 +889,7 @@ class EasyTL:
         response_type (literal["text", "raw"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, a TextResult object.
         semaphore (int) : The number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
         source_lang (string or Language or None) : The source language to translate from.
         context (string or None) : Additional information for the translator to be considered when translating. Not translated itself. This is a DeepL alpha feature and may be removed at any time.
         split_sentences (literal or SplitSentences or None) : How to split sentences.
@@ -453,7 +907,8 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
 
         EasyTL.test_credentials("deepl")
 
@@ -473,39 +928,202 @@ class EasyTL:
                                         decorator=decorator,
                                         logging_directory=logging_directory,
                                         semaphore=semaphore,
-                                        rate_limit_delay=translation_delay)
+                                        rate_limit_delay=translation_delay,
+                                        rate_limit_burst=translation_delay_burst)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
-        def translate(text):
-            return DeepLService._translate_text_async(text)
-        
-        if(decorator is not None):
-            translate = DeepLService._decorator_to_use(DeepLService._translate_text_async) ## type: ignore
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = DeepLService._decorated_translate_text_async or DeepLService._translate_text_async
 
-        else:
-            translate = DeepLService._translate_text_async
+        ## response_type is fixed for the whole call, so the projection over the results is picked once here rather than per element
+        _finalize = (lambda _rs: [_r.text for _r in _rs]) if response_type == "text" else (lambda _rs: _rs)
+
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
 
         if(isinstance(text, str)):
+
+            ## blank input translates to itself, don't pay a round-trip for it
+            if(response_type == "text" and not text.strip()):
+                return text
+
             _result = await translate(text)
 
-            assert not isinstance(_result, list), EasyTLException("Malformed response received. Please try again.")
+            if(isinstance(_result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
             result = _result if response_type == "raw" else _result.text
             
         elif(_is_iterable_of_strings(text)):
-            _tasks = [translate(t) for t in text]
-            _results = await asyncio.gather(*_tasks)
-            
-            assert isinstance(_results, list), EasyTLException("Malformed response received. Please try again.")
 
-            result = [_r.text for _r in _results] if response_type == "text" else _results # type: ignore
+            ## duplicate strings only pay for one API call each, results are fanned back out over the original input afterwards
+            _unique = list(dict.fromkeys(text))
+
+            ## blank strings have nothing to translate, so in text mode they skip the network and map to themselves (raw callers expect a response object per input, so those still go out)
+            _skipped = {}
+
+            if(response_type == "text"):
+                _skipped = {_t: _t for _t in _unique if not _t.strip()}
+                _unique = [_t for _t in _unique if _t.strip()]
+
+            ## cap the number of in-flight requests at the entry point, so huge iterables don't spawn one coroutine per element all at once
+            _sem = asyncio.Semaphore(semaphore or 15)
+
+            async def _bounded_translate(t):
+                async with _sem:
+                    return await translate(t)
+
+            ## DeepL accepts arrays of strings, so chunks of the iterable go out as a few batched requests instead of one per element.
+            ## A translation_delay or logging_directory implies per-call pacing/logging, so those keep the one-request-per-element fan-out.
+            if(translation_delay is None and logging_directory is None):
+                _chunks = [_unique[_i:_i + _DEEPL_BATCH_SIZE] for _i in range(0, len(_unique), _DEEPL_BATCH_SIZE)]
+                _chunk_results = await _gather_translations([_bounded_translate(_c) for _c in _chunks])
+                _unique_results = [_r for _chunk_result in _chunk_results for _r in _chunk_result]
+
+            else:
+                _unique_results = await _gather_translations([_bounded_translate(t) for t in _unique])
+
+            if(not (isinstance(_unique_results, list))):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            ## the projection only depends on response_type, applying it to the unique results here means duplicates don't pay for it twice
+            _result_map = dict(zip(_unique, _finalize(_unique_results)))
+            _result_map.update(_skipped)
+
+            result = [_result_map[t] for t in text]
                 
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
-        
+
         return result
-            
+
+##-------------------start-of-deepl_translate_iter()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    async def deepl_translate_iter(text:typing.Iterable[str],
+                            target_lang:str | Language = "EN-US",
+                            override_previous_settings:bool = True,
+                            decorator:typing.Callable | None = None,
+                            logging_directory:str | None = None,
+                            response_type:typing.Literal["text", "raw"] | None = "text",
+                            semaphore:int | None = 15,
+                            translation_delay:float | None = None,
+                            translation_delay_burst:int = 1,
+                            source_lang:str | Language | None = None,
+                            context:str | None = None,
+                            split_sentences:typing.Literal["OFF", "ALL", "NO_NEWLINES"] |  SplitSentences | None = "ALL",
+                            preserve_formatting:bool | None = None,
+                            formality:typing.Literal["default", "more", "less", "prefer_more", "prefer_less"] | Formality | None = None,
+                            glossary:str | GlossaryInfo | None = None,
+                            tag_handling:typing.Literal["xml", "html"] | None = None,
+                            outline_detection:bool | None = None,
+                            non_splitting_tags:str | typing.List[str] | None = None,
+                            splitting_tags:str | typing.List[str] | None = None,
+                            ignore_tags:str | typing.List[str] | None = None) -> typing.AsyncIterator[typing.Union[str, TextResult]]:
+
+        """
+
+        Streaming version of deepl_translate_async().
+
+        Yields each translation as soon as it completes instead of collecting them all into a list first, so at most `semaphore` requests and results are held in memory at any time. This makes it suitable for very large or unbounded iterables, which are consumed lazily.
+
+        Results are NOT guaranteed to arrive in input order. Use deepl_translate_async() if order matters.
+
+        This function assumes that the API key has already been set.
+
+        Parameters:
+        text (iterable) : The texts to translate. Consumed lazily, so generators are fine.
+        target_lang (string or Language) : The target language to translate to.
+        override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to a DeepL translation function.
+        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying. If this parameter is None, DeepL will retry your request 5 times before failing. Otherwise, the given decorator will be used.
+        logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
+        response_type (literal["text", "raw"]) : The type of response to yield. 'text' yields the translated text, 'raw' yields the raw response, a TextResult object.
+        semaphore (int) : The number of concurrent requests to make. Default is 15.
+        translation_delay (float or None) : The delay between each translation. Default is none.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        source_lang (string or Language or None) : The source language to translate from.
+        context (string or None) : Additional information for the translator to be considered when translating. Not translated itself. This is a DeepL alpha feature and may be removed at any time.
+        split_sentences (literal or SplitSentences or None) : How to split sentences.
+        preserve_formatting (bool or None) : Whether to preserve formatting.
+        formality (literal or Formality or None) : The formality level to use.
+        glossary (string or GlossaryInfo or None) : The glossary to use.
+        tag_handling (literal or None) : How to handle tags.
+        outline_detection (bool or None) : Whether to detect outlines.
+        non_splitting_tags (string or list or None) : Tags that should not be split.
+        splitting_tags (string or list or None) : Tags that should be split.
+        ignore_tags (string or list or None) : Tags that should be ignored.
+
+        Yields:
+        result (string or TextResult) : Each translation result as it completes. A string if the response type is 'text', a TextResult object otherwise.
+
+        """
+
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+
+        if(isinstance(text, str)):
+            raise InvalidTextInputException("text must be an iterable of strings.")
+
+        EasyTL.test_credentials("deepl")
+
+        if(override_previous_settings == True):
+            DeepLService._set_attributes(target_lang=target_lang,
+                                        source_lang=source_lang,
+                                        context=context,
+                                        split_sentences=split_sentences,
+                                        preserve_formatting=preserve_formatting,
+                                        formality=formality,
+                                        glossary=glossary,
+                                        tag_handling=tag_handling,
+                                        outline_detection=outline_detection,
+                                        non_splitting_tags=non_splitting_tags,
+                                        splitting_tags=splitting_tags,
+                                        ignore_tags=ignore_tags,
+                                        decorator=decorator,
+                                        logging_directory=logging_directory,
+                                        semaphore=semaphore,
+                                        rate_limit_delay=translation_delay,
+                                        rate_limit_burst=translation_delay_burst)
+
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = DeepLService._decorated_translate_text_async or DeepLService._translate_text_async
+
+        _window_size = semaphore or 15
+        _iterator = iter(text)
+        _pending:typing.Set[asyncio.Task] = set()
+        _exhausted = False
+
+        ## sliding window, a constant number of requests stays in flight and the next input is only pulled off the iterator when a slot frees up
+        try:
+            while(_pending or not _exhausted):
+
+                while(not _exhausted and len(_pending) < _window_size):
+
+                    try:
+                        _t = next(_iterator)
+
+                    except StopIteration:
+                        _exhausted = True
+                        break
+
+                    if(not isinstance(_t, str)):
+                        raise InvalidTextInputException("text must be an iterable of strings.")
+
+                    _pending.add(asyncio.ensure_future(translate(_t)))
+
+                if(not _pending):
+                    break
+
+                _done, _pending = await asyncio.wait(_pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for _task in _done:
+                    _result = _task.result()
+                    yield _result if response_type == "raw" else _result.text
+
+        finally:
+            for _task in _pending:
+                _task.cancel()
+
 ##-------------------start-of-gemini_translate()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -557,14 +1175,20 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
 
-        _settings = _return_curated_gemini_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_gemini_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
 
         _validate_easytl_llm_translation_settings(_settings, "gemini")
 
         _validate_stop_sequences(stop_sequences)
 
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         _validate_text_length(text, model, service="gemini")
 
         response_schema = _validate_response_schema(response_schema)
@@ -572,7 +1196,7 @@ class EasyTL:
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("gemini")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
+        json_mode = response_type in _JSON_TYPES
 
         if(override_previous_settings == True):
             GeminiService._set_attributes(model=model,
@@ -597,67 +1221,336 @@ class EasyTL:
         if(isinstance(text, str)):
             _result = GeminiService._translate_text(text)
             
-            assert not isinstance(_result, list) and hasattr(_result, "text"), EasyTLException("Malformed response received. Please try again.")
+            if(isinstance(_result, list) or not hasattr(_result, "text")):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
             
-            result = _result if response_type in ["raw", "raw_json"] else _result.text
+            result = _result if response_type in _RAW_TYPES else _result.text
 
         elif(_is_iterable_of_strings(text)):
-            
-            _results = [GeminiService._translate_text(t) for t in text]
 
-            assert isinstance(_results, list) and all([hasattr(_r, "text") for _r in _results]), EasyTLException("Malformed response received. Please try again.")
+            ## fan the blocking calls out over a thread pool instead of looping serially, the GIL is released during the network round-trip so they genuinely overlap (order is preserved by executor.map)
+            with ThreadPoolExecutor(max_workers=GeminiService._semaphore_value) as _executor:
+                _results = list(_executor.map(GeminiService._translate_text, text))
+
+            if(not (isinstance(_results, list) and all(hasattr(_r, "text") for _r in _results))):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-            result = [_r.text for _r in _results] if response_type in ["text","json"] else _results # type: ignore
+            result = [_r.text for _r in _results] if response_type in _TEXT_TYPES else _results # type: ignore
             
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
         
         return result
 
-##-------------------start-of-gemini_translate_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
-    
+##-------------------start-of-gemini_translate_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+    
+    @staticmethod
+    async def gemini_translate_async(text:typing.Union[str, typing.Iterable[str]],
+                                    override_previous_settings:bool = True,
+                                    decorator:typing.Callable | None = None,
+                                    logging_directory:str | None = None,
+                                    response_type:typing.Literal["text", "raw", "json", "raw_json"] | None = "text",
+                                    response_schema:str | typing.Mapping[str, typing.Any] | None = None,
+                                    semaphore:int | None = 5,
+                                    batch_size:int = 1,
+                                    translation_delay:float | None = None,
+                                    translation_delay_burst:int = 1,
+                                    translation_instructions:str | None = None,
+                                    model:str="gemini-pro",
+                                    temperature:float=0.5,
+                                    top_p:float=0.9,
+                                    top_k:int=40,
+                                    stop_sequences:typing.List[str] | None=None,
+                                    max_output_tokens:int | None=None) -> typing.Union[typing.List[str], str, AsyncGenerateContentResponse, typing.List[AsyncGenerateContentResponse]]:
+        
+        """
+
+        Asynchronous version of gemini_translate().
+        Will generally be faster for iterables. Order is preserved.
+
+        Translates the given text using Gemini.
+
+        This function assumes that the API key has already been set.
+
+        Translation instructions default to translating the text to English. To change this, specify the instructions.
+
+        This function is not for use for real-time translation, nor for generating multiple translation candidates. Another function may be implemented for this given demand.
+
+        It is not known whether Gemini has backoff retrying implemented. Assume it does not exist.
+        
+        Parameters:
+        text (string or iterable) : The text to translate.
+        override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to a Gemini translation function.
+        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
+        logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
+        response_type (literal["text", "raw", "json", "raw_json"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, an AsyncGenerateContentResponse object, 'json' returns a json-parseable string. 'raw_json' returns the raw response, an AsyncGenerateContentResponse object, but with the content as a json-parseable string.
+        response_schema (string or mapping or None) : The schema to use for the response. If None, no schema is used. This is only used if the response type is 'json' or 'json_raw'. EasyTL only validates the schema to the extend that it is None or a valid json. It does not validate the contents of the json.
+        semaphore (int) : The number of concurrent requests to make. Default is 5 for 1.0 and 2 for 1.5 gemini models. For Gemini, it is recommend to use translation_delay along with the semaphore to prevent rate limiting.
+        batch_size (int) : Experimental. If greater than 1 and text is an iterable of strings with response_type 'text', packs this many inputs into each request using numbered markers and splits the response back apart. Cuts per-request overhead on large iterables, at the cost of trusting the model to keep the markers intact. Default is 1 (one request per input).
+        translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        translation_instructions (string or None) : The translation instructions to use. If None, the default system message is used. If you plan on using the json response type, you must specify that you want a json output and it's format in the instructions. The default system message will ask for a generic json if the response type is json.
+        model (string) : The model to use. (E.g. 'gemini-pro' or 'gemini-pro-1.5-latest')
+        temperature (float) : The temperature to use. The higher the temperature, the more creative the output. Lower temperatures are typically better for translation.
+        top_p (float) : The nucleus sampling probability. The higher the value, the more words are considered for the next token. Generally, alter this or temperature, not both.
+        top_k (int) : The top k tokens to consider. Generally, alter this or temperature or top_p, not all three.
+        stop_sequences (list or None) : String sequences that will cause the model to stop translating if encountered, generally useless.
+        max_output_tokens (int or None) : The maximum number of tokens to output.
+
+        Returns:
+        result (string or list - string or AsyncGenerateContentResponse or list - AsyncGenerateContentResponse) : The translation result. A list of strings if the input was an iterable, a string otherwise. A list of AsyncGenerateContentResponse objects if the response type is 'raw' and input was an iterable, a AsyncGenerateContentResponse object otherwise.
+
+        """
+
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_gemini_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
+
+        _validate_easytl_llm_translation_settings(_settings, "gemini")
+
+        _validate_stop_sequences(stop_sequences)
+
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
+        _validate_text_length(text, model, service="gemini")
+
+        response_schema = _validate_response_schema(response_schema)
+
+        ## Should be done after validating the settings to reduce cost to the user
+        EasyTL.test_credentials("gemini")
+
+        json_mode = response_type in _JSON_TYPES
+
+        if(override_previous_settings == True):
+            GeminiService._set_attributes(model=model,
+                                          system_message=translation_instructions,
+                                          temperature=temperature,
+                                          top_p=top_p,
+                                          top_k=top_k,
+                                          candidate_count=1,
+                                          stream=False,
+                                          stop_sequences=stop_sequences,
+                                          max_output_tokens=max_output_tokens,
+                                          decorator=decorator,
+                                          logging_directory=logging_directory,
+                                          semaphore=semaphore,
+                                          rate_limit_delay=translation_delay,
+                                          rate_limit_burst=translation_delay_burst,
+                                          json_mode=json_mode,
+                                          response_schema=response_schema)
+            
+            ## Done afterwards, cause default translation instructions can change based on set_attributes()
+            GeminiService._system_message = translation_instructions or GeminiService._default_translation_instructions
+
+        ## experimental packed mode, several inputs share one request so the fixed prompt and HTTP overhead is paid once per group instead of once per string
+        if(batch_size > 1 and isinstance(text, (list, tuple)) and response_type == "text" and all(isinstance(_t, str) for _t in text)):
+
+            ## the marker-preservation instructions ride along in the request body itself rather than on the class-level system message,
+            ## which would accumulate across calls with override_previous_settings=False, leak into non-packed calls and force a client rebuild per packed call
+            _packed_prefix = _PACKED_BATCH_INSTRUCTIONS.strip() + "\n\n"
+
+            _groups = [text[_i:_i + batch_size] for _i in range(0, len(text), batch_size)]
+
+            _results = await _gather_translations(GeminiService._translate_text_async(_packed_prefix + _pack_texts(_group)) for _group in _groups)
+
+            return [_segment for _r, _group in zip(_results, _groups) for _segment in _unpack_packed_response(_r.text, len(_group))]
+
+        if(isinstance(text, str)):
+            _result = await GeminiService._translate_text_async(text)
+
+            result = _result if response_type in _RAW_TYPES else _result.text
+            
+        elif(_is_iterable_of_strings(text)):
+
+            ## cap the number of in-flight requests at the entry point, so huge iterables don't spawn one coroutine per element all at once
+            _sem = asyncio.Semaphore(semaphore or 15)
+
+            async def _bounded_translate(t):
+                async with _sem:
+                    return await GeminiService._translate_text_async(t)
+
+            if(response_type in _TEXT_TYPES):
+
+                ## raw responses are large, so for text responses each one is projected down to its text as it completes and filled in by index, instead of holding every raw response in memory until the gather finishes and then making a second pass
+                async def _indexed_translate(i, t):
+                    async with _sem:
+                        return i, await GeminiService._translate_text_async(t)
+
+                result = [""] * len(text)
+
+                for _future in asyncio.as_completed([_indexed_translate(_i, _t) for _i, _t in enumerate(text)]):
+                    _i, _r = await _future
+                    result[_i] = _r.text
+
+            else:
+                result = await _gather_translations([_bounded_translate(_t) for _t in text]) # type: ignore
+
+        else:
+            raise InvalidTextInputException("text must be a string or an iterable of strings.")
+
+        return result
+
+##-------------------start-of-gemini_translate_iter()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    async def gemini_translate_iter(text:typing.Iterable[str],
+                                    override_previous_settings:bool = True,
+                                    decorator:typing.Callable | None = None,
+                                    logging_directory:str | None = None,
+                                    response_type:typing.Literal["text", "raw"] | None = "text",
+                                    semaphore:int | None = 5,
+                                    translation_delay:float | None = None,
+                                    translation_delay_burst:int = 1,
+                                    translation_instructions:str | None = None,
+                                    model:str="gemini-pro",
+                                    temperature:float=0.5,
+                                    top_p:float=0.9,
+                                    top_k:int=40,
+                                    stop_sequences:typing.List[str] | None=None,
+                                    max_output_tokens:int | None=None) -> typing.AsyncIterator[typing.Union[str, AsyncGenerateContentResponse]]:
+
+        """
+
+        Streaming version of gemini_translate_async().
+
+        Yields each translation as soon as it completes instead of collecting them all into a list first, so at most `semaphore` requests and results are held in memory at any time. This makes it suitable for very large or unbounded iterables, which are consumed lazily.
+
+        Results are NOT guaranteed to arrive in input order. Use gemini_translate_async() if order matters.
+
+        This function assumes that the API key has already been set.
+
+        Parameters:
+        text (iterable) : The texts to translate. Consumed lazily, so generators are fine.
+        override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to a Gemini translation function.
+        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
+        logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
+        response_type (literal["text", "raw"]) : The type of response to yield. 'text' yields the translated text, 'raw' yields the raw response, an AsyncGenerateContentResponse object.
+        semaphore (int) : The number of concurrent requests to make. Default is 5.
+        translation_delay (float or None) : The delay between each translation. Default is none.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        translation_instructions (string or None) : The translation instructions to use. If None, the default system message is used.
+        model (string) : The model to use. (E.g. 'gemini-pro' or 'gemini-pro-1.5-latest')
+        temperature (float) : The temperature to use. The higher the temperature, the more creative the output. Lower temperatures are typically better for translation.
+        top_p (float) : The nucleus sampling probability. The higher the value, the more words are considered for the next token. Generally, alter this or temperature, not both.
+        top_k (int) : The top k tokens to consider. Generally, alter this or temperature or top_p, not all three.
+        stop_sequences (list or None) : String sequences that will cause the model to stop translating if encountered, generally useless.
+        max_output_tokens (int or None) : The maximum number of tokens to output.
+
+        Yields:
+        result (string or AsyncGenerateContentResponse) : Each translation result as it completes. A string if the response type is 'text', an AsyncGenerateContentResponse object otherwise.
+
+        """
+
+        if(response_type not in _TEXT_RAW_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'raw'.")
+
+        if(isinstance(text, str)):
+            raise InvalidTextInputException("text must be an iterable of strings.")
+
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_gemini_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
+
+        _validate_easytl_llm_translation_settings(_settings, "gemini")
+
+        _validate_stop_sequences(stop_sequences)
+
+        ## Should be done after validating the settings to reduce cost to the user
+        EasyTL.test_credentials("gemini")
+
+        if(override_previous_settings == True):
+            GeminiService._set_attributes(model=model,
+                                          system_message=translation_instructions,
+                                          temperature=temperature,
+                                          top_p=top_p,
+                                          top_k=top_k,
+                                          candidate_count=1,
+                                          stream=False,
+                                          stop_sequences=stop_sequences,
+                                          max_output_tokens=max_output_tokens,
+                                          decorator=decorator,
+                                          logging_directory=logging_directory,
+                                          semaphore=semaphore,
+                                          rate_limit_delay=translation_delay,
+                                          rate_limit_burst=translation_delay_burst,
+                                          json_mode=False,
+                                          response_schema=None)
+
+            ## Done afterwards, cause default translation instructions can change based on set_attributes()
+            GeminiService._system_message = translation_instructions or GeminiService._default_translation_instructions
+
+        translate = GeminiService._translate_text_async
+
+        _window_size = semaphore or 5
+        _iterator = iter(text)
+        _pending:typing.Set[asyncio.Task] = set()
+        _exhausted = False
+
+        ## sliding window, a constant number of requests stays in flight and the next input is only pulled off the iterator when a slot frees up
+        try:
+            while(_pending or not _exhausted):
+
+                while(not _exhausted and len(_pending) < _window_size):
+
+                    try:
+                        _t = next(_iterator)
+
+                    except StopIteration:
+                        _exhausted = True
+                        break
+
+                    if(not isinstance(_t, str)):
+                        raise InvalidTextInputException("text must be an iterable of strings.")
+
+                    _pending.add(asyncio.ensure_future(translate(_t)))
+
+                if(not _pending):
+                    break
+
+                _done, _pending = await asyncio.wait(_pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for _task in _done:
+                    _result = _task.result()
+                    yield _result if response_type == "raw" else _result.text
+
+        finally:
+            for _task in _pending:
+                _task.cancel()
+
+##-------------------start-of-gemini_translate_stream()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
     @staticmethod
-    async def gemini_translate_async(text:typing.Union[str, typing.Iterable[str]],
-                                    override_previous_settings:bool = True,
-                                    decorator:typing.Callable | None = None,
-                                    logging_directory:str | None = None,
-                                    response_type:typing.Literal["text", "raw", "json", "raw_json"] | None = "text",
-                                    response_schema:str | typing.Mapping[str, typing.Any] | None = None,
-                                    semaphore:int | None = 5,
-                                    translation_delay:float | None = None,
-                                    translation_instructions:str | None = None,
-                                    model:str="gemini-pro",
-                                    temperature:float=0.5,
-                                    top_p:float=0.9,
-                                    top_k:int=40,
-                                    stop_sequences:typing.List[str] | None=None,
-                                    max_output_tokens:int | None=None) -> typing.Union[typing.List[str], str, AsyncGenerateContentResponse, typing.List[AsyncGenerateContentResponse]]:
-        
+    async def gemini_translate_stream(text:str,
+                                      override_previous_settings:bool = True,
+                                      logging_directory:str | None = None,
+                                      translation_delay:float | None = None,
+                                      translation_delay_burst:int = 1,
+                                      translation_instructions:str | None = None,
+                                      model:str="gemini-pro",
+                                      temperature:float=0.5,
+                                      top_p:float=0.9,
+                                      top_k:int=40,
+                                      stop_sequences:typing.List[str] | None=None,
+                                      max_output_tokens:int | None=None) -> typing.AsyncIterator[str]:
+
         """
 
-        Asynchronous version of gemini_translate().
-        Will generally be faster for iterables. Order is preserved.
+        Translates a single text using Gemini, yielding pieces of the translation as the model produces them.
 
-        Translates the given text using Gemini.
+        The first chunk arrives as soon as the model starts generating — far sooner than the full translation on long outputs — so this is the entry point for anything that displays or pipelines the result incrementally. Use gemini_translate_async() when only the complete translation matters.
 
         This function assumes that the API key has already been set.
 
-        Translation instructions default to translating the text to English. To change this, specify the instructions.
-
-        This function is not for use for real-time translation, nor for generating multiple translation candidates. Another function may be implemented for this given demand.
-
-        It is not known whether Gemini has backoff retrying implemented. Assume it does not exist.
-        
         Parameters:
-        text (string or iterable) : The text to translate.
+        text (string) : The text to translate.
         override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to a Gemini translation function.
-        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
-        response_type (literal["text", "raw", "json", "raw_json"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, an AsyncGenerateContentResponse object, 'json' returns a json-parseable string. 'raw_json' returns the raw response, an AsyncGenerateContentResponse object, but with the content as a json-parseable string.
-        response_schema (string or mapping or None) : The schema to use for the response. If None, no schema is used. This is only used if the response type is 'json' or 'json_raw'. EasyTL only validates the schema to the extend that it is None or a valid json. It does not validate the contents of the json.
-        semaphore (int) : The number of concurrent requests to make. Default is 5 for 1.0 and 2 for 1.5 gemini models. For Gemini, it is recommend to use translation_delay along with the semaphore to prevent rate limiting.
-        translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
-        translation_instructions (string or None) : The translation instructions to use. If None, the default system message is used. If you plan on using the json response type, you must specify that you want a json output and it's format in the instructions. The default system message will ask for a generic json if the response type is json.
+        translation_delay (float or None) : The delay between each translation. Default is none.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        translation_instructions (string or None) : The translation instructions to use. If None, the default system message is used.
         model (string) : The model to use. (E.g. 'gemini-pro' or 'gemini-pro-1.5-latest')
         temperature (float) : The temperature to use. The higher the temperature, the more creative the output. Lower temperatures are typically better for translation.
         top_p (float) : The nucleus sampling probability. The higher the value, the more words are considered for the next token. Generally, alter this or temperature, not both.
@@ -665,14 +1558,16 @@ class EasyTL:
         stop_sequences (list or None) : String sequences that will cause the model to stop translating if encountered, generally useless.
         max_output_tokens (int or None) : The maximum number of tokens to output.
 
-        Returns:
-        result (string or list - string or AsyncGenerateContentResponse or list - AsyncGenerateContentResponse) : The translation result. A list of strings if the input was an iterable, a string otherwise. A list of AsyncGenerateContentResponse objects if the response type is 'raw' and input was an iterable, a AsyncGenerateContentResponse object otherwise.
+        Yields:
+        chunk (string) : The next piece of the translated text as it arrives.
 
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(not isinstance(text, str)):
+            raise InvalidTextInputException("text must be a string.")
 
-        _settings = _return_curated_gemini_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding
+        _settings = _return_curated_gemini_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
 
         _validate_easytl_llm_translation_settings(_settings, "gemini")
 
@@ -680,13 +1575,9 @@ class EasyTL:
 
         _validate_text_length(text, model, service="gemini")
 
-        response_schema = _validate_response_schema(response_schema)
-
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("gemini")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
-
         if(override_previous_settings == True):
             GeminiService._set_attributes(model=model,
                                           system_message=translation_instructions,
@@ -694,35 +1585,23 @@ class EasyTL:
                                           top_p=top_p,
                                           top_k=top_k,
                                           candidate_count=1,
-                                          stream=False,
+                                          stream=True,
                                           stop_sequences=stop_sequences,
                                           max_output_tokens=max_output_tokens,
-                                          decorator=decorator,
+                                          decorator=None,
                                           logging_directory=logging_directory,
-                                          semaphore=semaphore,
+                                          semaphore=None,
                                           rate_limit_delay=translation_delay,
-                                          json_mode=json_mode,
-                                          response_schema=response_schema)
-            
+                                          rate_limit_burst=translation_delay_burst,
+                                          json_mode=False,
+                                          response_schema=None)
+
             ## Done afterwards, cause default translation instructions can change based on set_attributes()
             GeminiService._system_message = translation_instructions or GeminiService._default_translation_instructions
-            
-        if(isinstance(text, str)):
-            _result = await GeminiService._translate_text_async(text)
 
-            result = _result if response_type in ["raw", "raw_json"] else _result.text
-            
-        elif(_is_iterable_of_strings(text)):
-            _tasks = [GeminiService._translate_text_async(_t) for _t in text]
-            _results = await asyncio.gather(*_tasks)
+        async for _chunk in GeminiService._translate_text_stream_async(text):
+            yield _chunk
 
-            result = [_r.text for _r in _results] if response_type in ["text","json"] else _results # type: ignore
-
-        else:
-            raise InvalidTextInputException("text must be a string or an iterable of strings.")
-        
-        return result
-            
 ##-------------------start-of-openai_translate()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -731,6 +1610,7 @@ class EasyTL:
                         decorator:typing.Callable | None = None,
                         logging_directory:str | None = None,
                         response_type:typing.Literal["text", "raw", "json", "raw_json"] | None = "text",
+                        concurrency:int | None = None,
                         translation_delay:float | None = None,
                         translation_instructions:str | SystemTranslationMessage | None = None,
                         model:str="gpt-4",
@@ -760,6 +1640,7 @@ class EasyTL:
         decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying. If this is None, OpenAI will retry the request twice if it fails.
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
         response_type (literal["text", "raw", "json", "raw_json"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, a ChatCompletion object, 'json' returns a json-parseable string. 'raw_json' returns the raw response, a ChatCompletion object, but with the content as a json-parseable string.
+        concurrency (int or None) : If text is an iterable, the number of concurrent requests to make. If None, the service's semaphore value is used.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
         translation_instructions (string or SystemTranslationMessage or None) : The translation instructions to use. If None, the default system message is used. If you plan on using the json response type, you must specify that you want a json output and it's format in the instructions. The default system message will ask for a generic json if the response type is json.
         model (string) : The model to use. (E.g. 'gpt-4', 'gpt-3.5-turbo-0125', 'gpt-4o', etc.)
@@ -775,20 +1656,26 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
 
-        _settings = _return_curated_openai_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_openai_settings({"model": model, "temperature": temperature, "top_p": top_p, "stop": stop, "max_tokens": max_tokens, "presence_penalty": presence_penalty, "frequency_penalty": frequency_penalty})
 
         _validate_easytl_llm_translation_settings(_settings, "openai")
 
         _validate_stop_sequences(stop)
 
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, ModelTranslationMessage, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         _validate_text_length(text, model, service="openai")
 
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("openai")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
+        json_mode = response_type in _JSON_TYPES
         
         if(override_previous_settings == True):
             OpenAIService._set_attributes(model=model,
@@ -812,26 +1699,40 @@ class EasyTL:
         else:
             translation_instructions = OpenAIService._system_message
 
-        assert isinstance(text, str) or _is_iterable_of_strings(text) or isinstance(text, ModelTranslationMessage) or _is_iterable_of_strings(text), InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+        ## a single pass over the input that accepts both element kinds at once, the old check scanned the iterable twice and never actually covered ModelTranslationMessage iterables
+        if(not (isinstance(text, (str, ModelTranslationMessage)) or (isinstance(text, (list, tuple)) and all(isinstance(_t, (str, ModelTranslationMessage)) for _t in text)))):
+            raise InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+
+        ## computed once and reused at the return site, which otherwise re-resolves isinstance(text, typing.Iterable) through the ABC machinery
+        _input_is_iterable = isinstance(text, (list, tuple))
 
         translation_batches = OpenAIService._build_translation_batches(text, translation_instructions)
-        
-        translations = []
-        
-        for _text, _translation_instructions in translation_batches:
 
-            _result = OpenAIService._translate_text(_translation_instructions, _text)
+        ## the response_type branch is resolved once here, rather than re-compared against the frozenset for every result in the loop below
+        _extract = (lambda _r: _r) if response_type in _RAW_TYPES else _get_openai_text
 
-            assert not isinstance(_result, list) and hasattr(_result, "choices"), EasyTLException("Malformed response received. Please try again.")
+        ## the dominant single-text case gets one direct call, no pool spin-up and no result-list materialization
+        if(not _input_is_iterable):
 
-            translation = _result if response_type in ["raw", "raw_json"] else _result.choices[0].message.content
-            
-            translations.append(translation)
-        
-        ## If originally a single text was provided, return a single translation instead of a list
-        result = translations if isinstance(text, typing.Iterable) and not isinstance(text, str) else translations[0]
-        
-        return result
+            ## the batches are a lazy generator, so the single pair is pulled off it rather than subscripted
+            _text, _instructions = next(translation_batches)
+
+            _result = OpenAIService._translate_text(_instructions, _text)
+
+            if(isinstance(_result, list) or not hasattr(_result, "choices")):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            return _extract(_result)
+
+        ## fan the blocking calls out over a thread pool instead of looping serially, the GIL is released during the network round-trip so they genuinely overlap (order is preserved by executor.map)
+        with ThreadPoolExecutor(max_workers=concurrency or OpenAIService._semaphore_value) as _executor:
+            _results = list(_executor.map(lambda _batch: OpenAIService._translate_text(_batch[1], _batch[0]), translation_batches))
+
+        if(any(isinstance(_result, list) or not hasattr(_result, "choices") for _result in _results)):
+            raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+        ## a comprehension pre-sizes from the length hint instead of growing by append
+        return [_extract(_result) for _result in _results]
     
 ##-------------------start-of-openai_translate_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -842,7 +1743,9 @@ class EasyTL:
                                     logging_directory:str | None = None,
                                     response_type:typing.Literal["text", "raw", "json", "raw_json"] | None = "text",
                                     semaphore:int | None = 5,
+                                    batch_size:int = 1,
                                     translation_delay:float | None = None,
+                                    translation_delay_burst:int = 1,
                                     translation_instructions:str | SystemTranslationMessage | None = None,
                                     model:str="gpt-4",
                                     temperature:float | None | NotGiven = NOT_GIVEN,
@@ -875,7 +1778,9 @@ class EasyTL:
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
         response_type (literal["text", "raw", "json", "raw_json"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, a ChatCompletion object, 'json' returns a json-parseable string. 'raw_json' returns the raw response, a ChatCompletion object, but with the content as a json-parseable string.
         semaphore (int) : The number of concurrent requests to make. Default is 5.
+        batch_size (int) : Experimental. If greater than 1 and text is an iterable of strings with response_type 'text', packs this many inputs into each request using numbered markers and splits the response back apart. Cuts per-request overhead on large iterables, at the cost of trusting the model to keep the markers intact. Default is 1 (one request per input).
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
         translation_instructions (string or SystemTranslationMessage or None) : The translation instructions to use. If None, the default system message is used. If you plan on using the json response type, you must specify that you want a json output and it's format in the instructions. The default system message will ask for a generic json if the response type is json.
         model (string) : The model to use. (E.g. 'gpt-4', 'gpt-3.5-turbo-0125', 'gpt-4o', etc.)
         temperature (float) : The temperature to use. The higher the temperature, the more creative the output. Lower temperatures are typically better for translation.
@@ -890,20 +1795,26 @@ class EasyTL:
         
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
 
-        _settings = _return_curated_openai_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_openai_settings({"model": model, "temperature": temperature, "top_p": top_p, "stop": stop, "max_tokens": max_tokens, "presence_penalty": presence_penalty, "frequency_penalty": frequency_penalty})
 
         _validate_easytl_llm_translation_settings(_settings, "openai")
 
         _validate_stop_sequences(stop)
 
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, ModelTranslationMessage, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         _validate_text_length(text, model, service="openai")
 
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("openai")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
+        json_mode = response_type in _JSON_TYPES
 
         if(override_previous_settings == True):
             OpenAIService._set_attributes(model=model,
@@ -919,6 +1830,7 @@ class EasyTL:
                                         logging_directory=logging_directory,
                                         semaphore=semaphore,
                                         rate_limit_delay=translation_delay,
+                                        rate_limit_burst=translation_delay_burst,
                                         json_mode=json_mode)
             
             ## Done afterwards, cause default translation instructions can change based on set_attributes()
@@ -927,25 +1839,65 @@ class EasyTL:
         else:
             translation_instructions = OpenAIService._system_message        
             
-        assert isinstance(text, str) or _is_iterable_of_strings(text) or isinstance(text, ModelTranslationMessage) or _is_iterable_of_strings(text), InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+        ## a single pass over the input that accepts both element kinds at once, the old check scanned the iterable twice and never actually covered ModelTranslationMessage iterables
+        if(not (isinstance(text, (str, ModelTranslationMessage)) or (isinstance(text, (list, tuple)) and all(isinstance(_t, (str, ModelTranslationMessage)) for _t in text)))):
+            raise InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+
+        ## computed once and reused at the return site, which otherwise re-resolves isinstance(text, typing.Iterable) through the ABC machinery
+        _input_is_iterable = isinstance(text, (list, tuple))
+
+        ## experimental packed mode, several inputs share one request so the fixed prompt and HTTP overhead is paid once per group instead of once per string
+        if(batch_size > 1 and _input_is_iterable and response_type == "text" and all(isinstance(_t, str) for _t in text)):
+
+            _instructions_text = translation_instructions.content if isinstance(translation_instructions, SystemTranslationMessage) else translation_instructions
+            _packed_instructions = SystemTranslationMessage(str(_instructions_text) + _PACKED_BATCH_INSTRUCTIONS)
+
+            _groups = [text[_i:_i + batch_size] for _i in range(0, len(text), batch_size)]
+
+            _translate = OpenAIService._translate_text_async
+
+            _results = await _gather_translations(_translate(_packed_instructions, ModelTranslationMessage(content=_pack_texts(_group))) for _group in _groups)
+
+            return [_segment for _r, _group in zip(_results, _groups) for _segment in _unpack_packed_response(_get_openai_text(_r), len(_group))]
 
         _translation_batches = OpenAIService._build_translation_batches(text, translation_instructions)
 
-        _translation_tasks = []
+        ## admission is already bounded by the service semaphore and smoothed by the shared rate limiter inside _translate_text_async, so everything can be submitted at once without bursting past the provider ceiling
+        ## the callable is hoisted and the batches are fed through as a generator, no intermediate list and no per-element class-attribute lookup
+        _translate = OpenAIService._translate_text_async
+
+        if(response_type in _RAW_TYPES):
+
+            _results = await _gather_translations(_translate(_translation_instructions, _text) for _text, _translation_instructions in _translation_batches)
 
-        for _text, _translation_instructions in _translation_batches:
-            _task = OpenAIService._translate_text_async(_translation_instructions, _text)
-            _translation_tasks.append(_task)
+            _results:typing.List[ChatCompletion] = _results
 
-        _results = await asyncio.gather(*_translation_tasks)
+            if(not all(hasattr(_r, "choices") for _r in _results)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-        _results:typing.List[ChatCompletion] = _results
+            translation = _results
 
-        assert all([hasattr(_r, "choices") for _r in _results]), EasyTLException("Malformed response received. Please try again.")
+        else:
+
+            ## raw ChatCompletion objects are large, so for text responses each one is projected down to its content as it completes and filled in by index, instead of holding every raw response until the slowest request returns
+            async def _indexed_translate(_i, _instructions, _text):
+                return _i, await _translate(_instructions, _text)
+
+            _batches = list(_translation_batches)
+
+            translation = [None] * len(_batches)
 
-        translation = _results if response_type in ["raw","raw_json"] else [result.choices[0].message.content for result in _results if result.choices[0].message.content is not None]
+            for _future in asyncio.as_completed([_indexed_translate(_i, _instructions, _text) for _i, (_text, _instructions) in enumerate(_batches)]):
+                _i, _r = await _future
 
-        result = translation if isinstance(text, typing.Iterable) and not isinstance(text, str) else translation[0]
+                if(not hasattr(_r, "choices")):
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                translation[_i] = _get_openai_text(_r)
+
+            translation = [_t for _t in translation if _t is not None]
+
+        result = translation if _input_is_iterable else translation[0]
 
         return result
     
@@ -1004,14 +1956,20 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
 
-        _settings = _return_curated_anthropic_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_anthropic_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
 
         _validate_easytl_llm_translation_settings(_settings, "anthropic")
 
         _validate_stop_sequences(stop_sequences)
 
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, ModelTranslationMessage, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         _validate_text_length(text, model, service="anthropic")
 
         response_schema = _validate_response_schema(response_schema)
@@ -1019,7 +1977,7 @@ class EasyTL:
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("anthropic")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
+        json_mode = response_type in _JSON_TYPES
 
         if(override_previous_settings == True):
             AnthropicService._set_attributes(model=model,
@@ -1040,40 +1998,58 @@ class EasyTL:
             ## Done afterwards, cause default translation instructions can change based on set_attributes()
             AnthropicService._system = translation_instructions or AnthropicService._default_translation_instructions
 
-        assert isinstance(text, str) or _is_iterable_of_strings(text) or isinstance(text, ModelTranslationMessage) or _is_iterable_of_strings(text), InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+        ## a single pass over the input that accepts both element kinds at once, the old check scanned the iterable twice and never actually covered ModelTranslationMessage iterables
+        if(not (isinstance(text, (str, ModelTranslationMessage)) or (isinstance(text, (list, tuple)) and all(isinstance(_t, (str, ModelTranslationMessage)) for _t in text)))):
+            raise InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+
+        ## computed once and reused at the return site, which otherwise re-resolves isinstance(text, typing.Iterable) through the ABC machinery
+        _input_is_iterable = isinstance(text, (list, tuple))
 
         _translation_batches = AnthropicService._build_translation_batches(text)
 
-        _translations = []
+        ## hoisted out of the loop, otherwise every iteration pays two class-attribute lookups
+        _system = AnthropicService._system
+        _translate = AnthropicService._translate_text
+
+        ## the response_type branch is resolved once here, rather than re-compared against the frozenset for every result in the loop below
+        if(response_type in _RAW_TYPES):
+            _extract = lambda _r: _r
 
-        for _text in _translation_batches:
+        else:
+            def _extract(_r):
 
-            _result = AnthropicService._translate_text(AnthropicService._system, _text)
+                ## response structure is different for beta
+                if(isinstance(_r, AnthropicToolsBetaMessage)):
+                    content = _r.content
 
-            assert not isinstance(_result, list) and hasattr(_result, "content"), EasyTLException("Malformed response received. Please try again.")
+                    if(isinstance(content[0], AnthropicTextBlock)):
+                        return content[0].text
 
-            if(response_type in ["raw", "raw_json"]):
-                translation = _result
+                    elif(isinstance(content[0], AnthropicToolUseBlock)):
+                        return content[0].input
 
-            ## response structure is different for beta
-            elif(isinstance(_result, AnthropicToolsBetaMessage)):
-                content = _result.content
+                elif(isinstance(_r, AnthropicMessage)):
+                    return _get_anthropic_text(_r)
 
-                if(isinstance(content[0], AnthropicTextBlock)):
-                    translation = content[0].text
+        ## the dominant single-text case gets one direct call, no pool spin-up and no result-list materialization
+        if(not _input_is_iterable):
 
-                elif(isinstance(content[0], AnthropicToolUseBlock)):
-                    translation = content[0].input
+            _result = _translate(_system, _translation_batches[0])
 
-            elif(isinstance(_result, AnthropicMessage)):
-                translation = _result.content[0].text
-                            
-            _translations.append(translation)
+            if(isinstance(_result, list) or not hasattr(_result, "content")):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-        ## If originally a single text was provided, return a single translation instead of a list
-        result = _translations if isinstance(text, typing.Iterable) and not isinstance(text, str) else _translations[0]
+            return _extract(_result)
 
-        return result
+        ## fan the blocking calls out over a thread pool instead of looping serially, the GIL is released during the network round-trip so they genuinely overlap (order is preserved by executor.map)
+        with ThreadPoolExecutor(max_workers=AnthropicService._semaphore_value) as _executor:
+            _results = list(_executor.map(lambda _text: _translate(_system, _text), _translation_batches))
+
+        if(any(isinstance(_result, list) or not hasattr(_result, "content") for _result in _results)):
+            raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+        ## a comprehension pre-sizes from the length hint instead of growing by append
+        return [_extract(_result) for _result in _results]
     
 ##-------------------start-of-anthropic_translate_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -1085,7 +2061,9 @@ class EasyTL:
                                         response_type:typing.Literal["text", "raw", "json", "raw_json"] | None = "text",
                                         response_schema:str | typing.Mapping[str, typing.Any] | None = None,
                                         semaphore:int | None = 5,
+                                        batch_size:int = 1,
                                         translation_delay:float | None = None,
+                                        translation_delay_burst:int = 1,
                                         translation_instructions:str | None = None,
                                         model:str="claude-3-haiku-20240307",
                                         temperature:float | NotGiven = NOT_GIVEN,
@@ -1121,7 +2099,9 @@ class EasyTL:
         response_type (literal["text", "raw", "json", "raw_json"]) : The type of response to return. 'text' returns the translated text, 'raw' returns the raw response, an AnthropicMessage object, 'json' returns a json-parseable string. 'raw_json' returns the raw response, an AnthropicMessage object, but with the content as a json-parseable string.
         response_schema (string or mapping or None) : The schema to use for the response. If None, no schema is used. This is only used if the response type is 'json' or 'json_raw'. EasyTL only validates the schema to the extend that it is None or a valid json. It does not validate the contents of the json.
         semaphore (int) : The number of concurrent requests to make. Default is 5.
+        batch_size (int) : Experimental. If greater than 1 and text is an iterable of strings with response_type 'text', packs this many inputs into each request using numbered markers and splits the response back apart. Cuts per-request overhead on large iterables, at the cost of trusting the model to keep the markers intact. Default is 1 (one request per input).
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
         translation_instructions (string or SystemTranslationMessage or None) : The translation instructions to use. If None, the default system message is used. If you plan on using the json response type, you must specify that you want a json output and it's format in the instructions. The default system message will ask for a generic json if the response type is json.
         model (string) : The model to use. (E.g. 'claude-3-haiku-20240307', 'claude-3-sonnet-20240229' or 'claude-3-opus-20240229')
         temperature (float or NotGiven) : The temperature to use. The higher the temperature, the more creative the output. Lower temperatures are typically better for translation.
@@ -1135,14 +2115,20 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "raw", "json", "raw_json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
+        if(response_type not in _LLM_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text', 'raw', 'json' or 'raw_json'.")
 
-        _settings = _return_curated_anthropic_settings(locals())
+        ## only the parameters the curator actually reads, locals() would snapshot every binding including the full text iterable
+        _settings = _return_curated_anthropic_settings({"model": model, "temperature": temperature, "top_p": top_p, "top_k": top_k, "stop_sequences": stop_sequences, "max_output_tokens": max_output_tokens})
 
         _validate_easytl_llm_translation_settings(_settings, "anthropic")
 
         _validate_stop_sequences(stop_sequences)
 
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once before anything iterates them
+        if(not isinstance(text, (str, ModelTranslationMessage, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
+
         _validate_text_length(text, model, service="anthropic")
 
         response_schema = _validate_response_schema(response_schema)
@@ -1150,7 +2136,7 @@ class EasyTL:
         ## Should be done after validating the settings to reduce cost to the user
         EasyTL.test_credentials("anthropic")
 
-        json_mode = True if response_type in ["json", "raw_json"] else False
+        json_mode = response_type in _JSON_TYPES
 
         if(override_previous_settings == True):
             AnthropicService._set_attributes(model=model,
@@ -1165,39 +2151,79 @@ class EasyTL:
                                             logging_directory=logging_directory,
                                             semaphore=semaphore,
                                             rate_limit_delay=translation_delay,
+                                            rate_limit_burst=translation_delay_burst,
                                             json_mode=json_mode,
                                             response_schema=response_schema)
             
             ## Done afterwards, cause default translation instructions can change based on set_attributes()
             AnthropicService._system = translation_instructions or AnthropicService._default_translation_instructions
         
-        assert isinstance(text, str) or _is_iterable_of_strings(text) or isinstance(text, ModelTranslationMessage) or _is_iterable_of_strings(text), InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+        ## a single pass over the input that accepts both element kinds at once, the old check scanned the iterable twice and never actually covered ModelTranslationMessage iterables
+        if(not (isinstance(text, (str, ModelTranslationMessage)) or (isinstance(text, (list, tuple)) and all(isinstance(_t, (str, ModelTranslationMessage)) for _t in text)))):
+            raise InvalidTextInputException("text must be a string, an iterable of strings, a ModelTranslationMessage or an iterable of ModelTranslationMessages.")
+
+        ## computed once and reused at the return site, which otherwise re-resolves isinstance(text, typing.Iterable) through the ABC machinery
+        _input_is_iterable = isinstance(text, (list, tuple))
+
+        ## experimental packed mode, several inputs share one request so the fixed prompt and HTTP overhead is paid once per group instead of once per string
+        if(batch_size > 1 and _input_is_iterable and response_type == "text" and all(isinstance(_t, str) for _t in text)):
+
+            _packed_system = str(AnthropicService._system or "") + _PACKED_BATCH_INSTRUCTIONS
+
+            _groups = [text[_i:_i + batch_size] for _i in range(0, len(text), batch_size)]
+
+            _translate = AnthropicService._translate_text_async
+
+            _results = await _gather_translations(_translate(_packed_system, ModelTranslationMessage(content=_pack_texts(_group))) for _group in _groups)
+
+            return [_segment for _r, _group in zip(_results, _groups) for _segment in _unpack_packed_response(_get_anthropic_text(_r), len(_group))]
 
         _translation_batches = AnthropicService._build_translation_batches(text)
 
-        _translations_tasks = []
+        ## admission is already bounded by the service semaphore and smoothed by the shared rate limiter inside _translate_text_async, so everything can be submitted at once without bursting past the provider ceiling
+        ## the system message and callable are hoisted and the batches are fed through as a generator, no intermediate list and no per-element class-attribute lookup
+        _system = AnthropicService._system
+        _translate = AnthropicService._translate_text_async
 
-        for _text in _translation_batches:
-            _task = AnthropicService._translate_text_async(AnthropicService._system, _text)
-            _translations_tasks.append(_task)
+        if(response_type in _RAW_TYPES):
 
-        _results = await asyncio.gather(*_translations_tasks)
+            _results = await _gather_translations(_translate(_system, _text) for _text in _translation_batches)
 
-        _results:typing.List[AnthropicMessage | AnthropicToolsBetaMessage] = _results
+            _results:typing.List[AnthropicMessage | AnthropicToolsBetaMessage] = _results
 
-        assert all([hasattr(_r, "content") for _r in _results]), EasyTLException("Malformed response received. Please try again.")
+            if(not all(hasattr(_r, "content") for _r in _results)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-        if(response_type in ["raw", "raw_json"]):
             translations = _results
 
-        ## response structure is different for beta
-        elif(isinstance(_results[0], AnthropicToolsBetaMessage)):
-            translations = [result.content[0].input if isinstance(result.content[0], AnthropicToolUseBlock) else result.content[0].text for result in _results]
-        
-        elif(isinstance(_results[0], AnthropicMessage)):
-            translations = [result.content[0].text for result in _results if isinstance(result.content[0], AnthropicTextBlock)]
+        else:
+
+            ## raw AnthropicMessage objects are large, so for text responses each one is projected down to its content as it completes and filled in by index, instead of holding every raw response until the slowest request returns
+            async def _indexed_translate(_i, _text):
+                return _i, await _translate(_system, _text)
+
+            _batches = list(_translation_batches)
+
+            translations = [None] * len(_batches)
+
+            for _future in asyncio.as_completed([_indexed_translate(_i, _text) for _i, _text in enumerate(_batches)]):
+                _i, _r = await _future
+
+                if(not hasattr(_r, "content")):
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                ## response structure is different for beta
+                if(isinstance(_r, AnthropicToolsBetaMessage)):
+                    translations[_i] = _r.content[0].input if isinstance(_r.content[0], AnthropicToolUseBlock) else _get_anthropic_text(_r)
+
+                elif(isinstance(_r, AnthropicMessage)):
+                    translations[_i] = _get_anthropic_text(_r)
+
+                ## an unrecognized message shape is an error, silently dropping it would misalign the output with the input
+                else:
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
                 
-        result = translations if isinstance(text, typing.Iterable) and not isinstance(text, str) else translations[0]
+        result = translations if _input_is_iterable else translations[0]
 
         return result # type: ignore
     
@@ -1210,6 +2236,7 @@ class EasyTL:
                         decorator:typing.Callable | None = None,
                         logging_directory:str | None = None,
                         response_type:typing.Literal["text", "json"] | None = "text",
+                        concurrency:int | None = 15,
                         translation_delay:float | None = None,
                         api_version:str = '3.0',
                         azure_region:str = "global",
@@ -1233,6 +2260,7 @@ class EasyTL:
         decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying. 
         logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
         response_type (literal["text", "json"]) : The type of response to return. 'text' returns the translated text, 'json' returns the original response in json format.
+        concurrency (int) : If text is an iterable, the number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
         api_version (string) : The version of the Azure Translator API. Default is '3.0'.
         azure_region (string) : The Azure region to use for translation. Default is 'global'.
@@ -1244,7 +2272,20 @@ class EasyTL:
 
         """
 
-        assert response_type in ["text", "json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'json'.")
+        if(response_type not in _AZURE_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'json'.")
+
+        ## a changed region or endpoint invalidates any cached credential validation, the probe has to hit the deployment actually being used
+        if(azure_region != AzureService._location or azure_endpoint != AzureService._endpoint):
+            with _validated_credentials_lock:
+                _validated_credentials.pop("azure", None)
+
+            ## cached responses came from the old deployment too, the cache key carries only (source_lang, target_lang, text)
+            AzureService._translation_cache.clear()
+
+        ## likewise for a changed API version, which can alter the response payload without touching credentials
+        elif(api_version != AzureService._api_version):
+            AzureService._translation_cache.clear()
 
         EasyTL.test_credentials("azure")
 
@@ -1259,33 +2300,81 @@ class EasyTL:
                                         semaphore=None,
                                         rate_limit_delay=translation_delay)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = AzureService._decorated_translate_text or AzureService._translate_text
 
-        def translate(text):
-            return AzureService._translate_text(text)
-        
-        if(decorator is not None):
-            translate = AzureService._decorator_to_use(AzureService._translate_text) # type: ignore
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
 
-        else:
-            translate = AzureService._translate_text
+        _cache = AzureService._translation_cache
 
         if(isinstance(text, str)):
 
-            result = translate(text)[0]
+            _response = _cache.get((source_lang, target_lang, text))
 
-            assert not isinstance(result, list), EasyTLException("Malformed response received. Please try again.")
+            if(_response is None):
+                _response = translate(text)
+
+                ## only a well-formed payload may enter the cache, anything else would be pinned and replayed for every later request of this text
+                if(not isinstance(_response, list)):
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                _cache[(source_lang, target_lang, text)] = _response
+
+            result = _response[0]
+
+            if(isinstance(result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            result = result if response_type == "json" else _get_azure_text(_response)
 
-            result = result if response_type == "json" else result['translations'][0]['text']
-        
         elif(_is_iterable_of_strings(text)):
 
-            _results = [translate(_t) for _t in text]
+            ## strings translated earlier in the process are served from the cache, only the misses go over the network, deduplicated so repeats within the input cost one request
+            _misses = list(dict.fromkeys(_t for _t in text if (source_lang, target_lang, _t) not in _cache))
+
+            ## Azure accepts up to 100 strings per request, so the misses go out as a few batched requests instead of one per element.
+            ## A translation_delay or logging_directory implies per-call pacing/logging, so those keep the one-request-per-element fan-out.
+            if(translation_delay is None and logging_directory is None):
+
+                _translate_batch = AzureService._decorated_translate_text_batch or AzureService._translate_text_batch
+
+                _chunks = [_misses[_i:_i + _AZURE_BATCH_SIZE] for _i in range(0, len(_misses), _AZURE_BATCH_SIZE)]
+
+                with ThreadPoolExecutor(max_workers=concurrency) as _executor:
+                    _chunk_results = list(_executor.map(_translate_batch, _chunks))
+
+                for _chunk, _chunk_result in zip(_chunks, _chunk_results):
 
-            assert isinstance(_results, list), EasyTLException("Malformed response received. Please try again.")
+                    ## a batch response missing entries (or not a list at all) must not be cached, zip() would silently pair up whatever is there
+                    if(not isinstance(_chunk_result, list) or len(_chunk_result) != len(_chunk)):
+                        raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-            result = _results if response_type == "json" else [result[0]['translations'][0]['text'] for result in _results]
+                    for _t, _r in zip(_chunk, _chunk_result):
+                        ## stored in the same one-entry-list shape the per-element endpoint returns, so the projection below doesn't care which path filled the cache
+                        _cache[(source_lang, target_lang, _t)] = [_r]
+
+            else:
+
+                ## fan the blocking calls out over a thread pool instead of looping serially, N requests take roughly ceil(N / concurrency) round-trips instead of N
+                with ThreadPoolExecutor(max_workers=concurrency) as _executor:
+                    _miss_results = list(_executor.map(translate, _misses))
+
+                for _t, _r in zip(_misses, _miss_results):
+
+                    ## only a well-formed payload may enter the cache, anything else would be pinned and replayed for every later request of this text
+                    if(not isinstance(_r, list)):
+                        raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                    _cache[(source_lang, target_lang, _t)] = _r
+
+            ## for text output the extraction is fused into the walk over the input, so an intermediate list of N full response payloads is never materialized
+            if(response_type == "json"):
+                result = [_cache[(source_lang, target_lang, _t)] for _t in text]
+
+            else:
+                result = [_get_azure_text(_cache[(source_lang, target_lang, _t)]) for _t in text]
 
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
@@ -1303,6 +2392,7 @@ class EasyTL:
                                     response_type:typing.Literal["text", "json"] | None = "text",
                                     semaphore:int | None = 15,
                                     translation_delay:float | None = None,
+                                    translation_delay_burst:int = 1,
                                     api_version:str = '3.0',
                                     azure_region:str = "global",
                                     azure_endpoint:str = "https://api.cognitive.microsofttranslator.com/",
@@ -1329,6 +2419,7 @@ class EasyTL:
         response_type (literal["text", "json"]) : The type of response to return. 'text' returns the translated text, 'json' returns the original response in json format.
         semaphore (int) : The number of concurrent requests to make. Default is 15.
         translation_delay (float or None) : If text is an iterable, the delay between each translation. Default is none. This is more important for asynchronous translations where a semaphore alone may not be sufficient.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
         api_version (string) : The version of the Azure Translator API. Default is '3.0'.
         azure_region (string) : The Azure region to use for translation. Default is 'global'.
         azure_endpoint (string) : The Azure Translator API endpoint. Default is 'https://api.cognitive.microsofttranslator.com/'.
@@ -1339,7 +2430,20 @@ class EasyTL:
         
         """
 
-        assert response_type in ["text", "json"], InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'json'.")
+        if(response_type not in _AZURE_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'json'.")
+
+        ## a changed region or endpoint invalidates any cached credential validation, the probe has to hit the deployment actually being used
+        if(azure_region != AzureService._location or azure_endpoint != AzureService._endpoint):
+            with _validated_credentials_lock:
+                _validated_credentials.pop("azure", None)
+
+            ## cached responses came from the old deployment too, the cache key carries only (source_lang, target_lang, text)
+            AzureService._translation_cache.clear()
+
+        ## likewise for a changed API version, which can alter the response payload without touching credentials
+        elif(api_version != AzureService._api_version):
+            AzureService._translation_cache.clear()
 
         EasyTL.test_credentials("azure")
 
@@ -1352,42 +2456,216 @@ class EasyTL:
                                         decorator=decorator,
                                         log_directory=logging_directory,
                                         semaphore=semaphore,
-                                        rate_limit_delay=translation_delay)
+                                        rate_limit_delay=translation_delay,
+                                        rate_limit_burst=translation_delay_burst)
             
-        ## This section may seem overly complex, but it is necessary to apply the decorator outside of the function call to avoid infinite recursion.
-        ## Attempting to dynamically apply the decorator within the function leads to unexpected behavior, where this function's arguments are passed to the function instead of the intended translation function.
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = AzureService._decorated_translate_text_async or AzureService._translate_text_async
 
-        async def translate(text):
-            return await AzureService._translate_text_async(text)
-        
-        if(decorator is not None):
-            translate = AzureService._decorator_to_use(AzureService._translate_text_async) # type: ignore
+        ## one-shot iterables (generators) would otherwise be consumed by validation, so materialize them once up front
+        if(not isinstance(text, (str, list, tuple)) and hasattr(text, "__iter__")):
+            text = list(text)
 
-        else:
-            translate = AzureService._translate_text_async
+        _cache = AzureService._translation_cache
 
         if(isinstance(text, str)):
 
-            result = (await translate(text))[0]
+            _response = _cache.get((source_lang, target_lang, text))
+
+            if(_response is None):
+                _response = await translate(text)
+
+                ## only a well-formed payload may enter the cache, anything else would be pinned and replayed for every later request of this text
+                if(not isinstance(_response, list)):
+                    raise EasyTLException(_MALFORMED_RESPONSE_MSG)
 
-            assert not isinstance(result, list), EasyTLException("Malformed response received. Please try again.")
+                _cache[(source_lang, target_lang, text)] = _response
 
-            result = result if response_type == "json" else result['translations'][0]['text']
+            result = _response[0]
+
+            if(isinstance(result, list)):
+                raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+            result = result if response_type == "json" else _get_azure_text(_response)
 
         elif(_is_iterable_of_strings(text)):
 
-            _tasks = [translate(_t) for _t in text]
-            _results = await asyncio.gather(*_tasks)
+            ## cap the number of in-flight requests at the entry point, so huge iterables don't spawn one coroutine per element all at once
+            _sem = asyncio.Semaphore(semaphore or 15)
+
+            async def _bounded_translate(_t):
+                async with _sem:
+                    return await translate(_t)
+
+            ## strings translated earlier in the process are served from the cache, only the misses go over the network, deduplicated so repeats within the input cost one request
+            _misses = list(dict.fromkeys(_t for _t in text if (source_lang, target_lang, _t) not in _cache))
+
+            ## Azure accepts up to 100 strings per request, so the misses go out as a few batched requests instead of one per element.
+            ## A translation_delay or logging_directory implies per-call pacing/logging, so those keep the one-request-per-element fan-out.
+            if(translation_delay is None and logging_directory is None):
+
+                _translate_batch = AzureService._decorated_translate_text_batch_async or AzureService._translate_text_batch_async
+
+                async def _bounded_translate_batch(_chunk):
+                    async with _sem:
+                        return await _translate_batch(_chunk)
+
+                _chunks = [_misses[_i:_i + _AZURE_BATCH_SIZE] for _i in range(0, len(_misses), _AZURE_BATCH_SIZE)]
 
-            assert isinstance(_results, list), EasyTLException("Malformed response received. Please try again.")
+                _chunk_results = await _gather_translations([_bounded_translate_batch(_c) for _c in _chunks])
 
-            result = _results if response_type == "json" else [result[0]['translations'][0]['text'] for result in _results]
+                for _chunk, _chunk_result in zip(_chunks, _chunk_results):
+
+                    ## a batch response missing entries (or not a list at all) must not be cached, zip() would silently pair up whatever is there
+                    if(not isinstance(_chunk_result, list) or len(_chunk_result) != len(_chunk)):
+                        raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                    for _t, _r in zip(_chunk, _chunk_result):
+                        ## stored in the same one-entry-list shape the per-element endpoint returns, so the projection below doesn't care which path filled the cache
+                        _cache[(source_lang, target_lang, _t)] = [_r]
+
+            else:
+
+                _miss_results = await _gather_translations([_bounded_translate(_t) for _t in _misses])
+
+                for _t, _r in zip(_misses, _miss_results):
+
+                    ## only a well-formed payload may enter the cache, anything else would be pinned and replayed for every later request of this text
+                    if(not isinstance(_r, list)):
+                        raise EasyTLException(_MALFORMED_RESPONSE_MSG)
+
+                    _cache[(source_lang, target_lang, _t)] = _r
+
+            ## for text output the extraction is fused into the walk over the input, so an intermediate list of N full response payloads is never materialized
+            if(response_type == "json"):
+                result = [_cache[(source_lang, target_lang, _t)] for _t in text]
+
+            else:
+                result = [_get_azure_text(_cache[(source_lang, target_lang, _t)]) for _t in text]
 
         else:
             raise InvalidTextInputException("text must be a string or an iterable of strings.")
         
         return result # type: ignore
 
+##-------------------start-of-azure_translate_iter()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    async def azure_translate_iter(text:typing.Iterable[str],
+                                   target_lang:str = 'en',
+                                   override_previous_settings:bool = True,
+                                   decorator:typing.Callable | None = None,
+                                   logging_directory:str | None = None,
+                                   response_type:typing.Literal["text", "json"] | None = "text",
+                                   semaphore:int | None = 15,
+                                   translation_delay:float | None = None,
+                                   translation_delay_burst:int = 1,
+                                   api_version:str = '3.0',
+                                   azure_region:str = "global",
+                                   azure_endpoint:str = "https://api.cognitive.microsofttranslator.com/",
+                                   source_lang:str | None = None) -> typing.AsyncIterator[typing.Union[str, typing.Any]]:
+
+        """
+
+        Streaming version of azure_translate_async().
+
+        Yields each translation as soon as it completes instead of collecting them all into a list first, so at most `semaphore` requests and results are held in memory at any time. This makes it suitable for very large or unbounded iterables, which are consumed lazily.
+
+        Results are NOT guaranteed to arrive in input order. Use azure_translate_async() if order matters.
+
+        This function assumes that the API key has already been set.
+
+        Parameters:
+        text (iterable) : The texts to translate. Consumed lazily, so generators are fine.
+        target_lang (string) : The target language for translation. Default is 'en'. These are ISO 639-1 language codes
+        override_previous_settings (bool) : Whether to override the previous settings that were used during the last call to an Azure translation function.
+        decorator (callable or None) : The decorator to use when translating. Typically for exponential backoff retrying.
+        logging_directory (string or None) : The directory to log to. If None, no logging is done. This'll append the text result and some function information to a file in the specified directory. File is created if it doesn't exist.
+        response_type (literal["text", "json"]) : The type of response to yield. 'text' yields the translated text, 'json' yields the original response in json format.
+        semaphore (int) : The number of concurrent requests to make. Default is 15.
+        translation_delay (float or None) : The delay between each translation. Default is none.
+        translation_delay_burst (int) : How many requests may go out back-to-back before the translation_delay spacing kicks in. Default is 1, which keeps strict spacing.
+        api_version (string) : The version of the Azure Translator API. Default is '3.0'.
+        azure_region (string) : The Azure region to use for translation. Default is 'global'.
+        azure_endpoint (string) : The Azure Translator API endpoint. Default is 'https://api.cognitive.microsofttranslator.com/'.
+        source_lang (string or None) : The source language of the text. If None, the service will attempt to detect the language.
+
+        Yields:
+        result (string or any) : Each translation result as it completes. A string if the response type is 'text', the raw response otherwise.
+
+        """
+
+        if(response_type not in _AZURE_RESPONSE_TYPES):
+            raise InvalidResponseFormatException("Invalid response type specified. Must be 'text' or 'json'.")
+
+        if(isinstance(text, str)):
+            raise InvalidTextInputException("text must be an iterable of strings.")
+
+        ## a changed region or endpoint invalidates any cached credential validation, the probe has to hit the deployment actually being used
+        if(azure_region != AzureService._location or azure_endpoint != AzureService._endpoint):
+            with _validated_credentials_lock:
+                _validated_credentials.pop("azure", None)
+
+            ## cached responses came from the old deployment too, the cache key carries only (source_lang, target_lang, text)
+            AzureService._translation_cache.clear()
+
+        ## likewise for a changed API version, which can alter the response payload without touching credentials
+        elif(api_version != AzureService._api_version):
+            AzureService._translation_cache.clear()
+
+        EasyTL.test_credentials("azure")
+
+        if(override_previous_settings == True):
+            AzureService._set_attributes(target_language=target_lang,
+                                        api_version=api_version,
+                                        azure_region=azure_region,
+                                        azure_endpoint=azure_endpoint,
+                                        source_language=source_lang,
+                                        decorator=decorator,
+                                        log_directory=logging_directory,
+                                        semaphore=semaphore,
+                                        rate_limit_delay=translation_delay,
+                                        rate_limit_burst=translation_delay_burst)
+
+        ## The decorator must be applied outside of the function call to avoid infinite recursion, the wrapped function is cached by _set_attributes() so it isn't rebuilt on every call.
+        translate = AzureService._decorated_translate_text_async or AzureService._translate_text_async
+
+        _window_size = semaphore or 15
+        _iterator = iter(text)
+        _pending:typing.Set[asyncio.Task] = set()
+        _exhausted = False
+
+        ## sliding window, a constant number of requests stays in flight and the next input is only pulled off the iterator when a slot frees up
+        try:
+            while(_pending or not _exhausted):
+
+                while(not _exhausted and len(_pending) < _window_size):
+
+                    try:
+                        _t = next(_iterator)
+
+                    except StopIteration:
+                        _exhausted = True
+                        break
+
+                    if(not isinstance(_t, str)):
+                        raise InvalidTextInputException("text must be an iterable of strings.")
+
+                    _pending.add(asyncio.ensure_future(translate(_t)))
+
+                if(not _pending):
+                    break
+
+                _done, _pending = await asyncio.wait(_pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for _task in _done:
+                    _result = _task.result()
+                    yield _result if response_type == "json" else _get_azure_text(_result)
+
+        finally:
+            for _task in _pending:
+                _task.cancel()
+
 ##-------------------start-of-translate()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         
     @staticmethod
@@ -1431,26 +2709,43 @@ class EasyTL:
 
         """
 
-        assert service in ["deepl", "openai", "gemini", "google translate", "anthropic", "azure"], InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
+        _translate_fn = _TRANSLATE_DISPATCH.get(service)
 
-        if(service == "deepl"):
-            return EasyTL.deepl_translate(text, **kwargs)
+        if(_translate_fn is None):
+            raise InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
 
-        elif(service == "openai"):
-            return EasyTL.openai_translate(text, **kwargs)
+        return _translate_fn(text, **kwargs)
+
+##-------------------start-of-bind()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def bind(service:typing.Literal["deepl", "openai", "gemini", "google translate", "anthropic", "azure"],
+             **defaults) -> typing.Callable:
+
+        """
+
+        Returns a callable pre-bound to the given service and keyword defaults, for hot loops that always use the same service.
+
+        The service lookup happens once here instead of on every call, and the defaults are merged at C level via functools.partial. Keyword arguments passed to the returned callable override the bound defaults.
+
+        e.g. tr = EasyTL.bind("azure", target_lang="fr"); tr(text)
+
+        Parameters:
+        service (string) : The service to bind to.
+        **defaults : Keyword arguments baked into every call.
+
+        Returns:
+        bound (callable) : The pre-bound translation function.
+
+        """
+
+        _translate_fn = _TRANSLATE_DISPATCH.get(service)
+
+        if(_translate_fn is None):
+            raise InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
+
+        return partial(_translate_fn, **defaults)
 
-        elif(service == "gemini"):
-           return EasyTL.gemini_translate(text, **kwargs)
-        
-        elif(service == "google translate"):
-            return EasyTL.googletl_translate(text, **kwargs)
-        
-        elif(service == "anthropic"):
-            return EasyTL.anthropic_translate(text, **kwargs)
-        
-        elif(service == "azure"):
-            return EasyTL.azure_translate(text, **kwargs)
-        
 ##-------------------start-of-translate_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     
     @staticmethod
@@ -1472,6 +2767,8 @@ class EasyTL:
         This function assumes that the API key has already been set.
         translate_async() will generally be faster for iterables. Order is preserved.
 
+        When the optional uvloop package is installed (Linux/macOS), it is used as the event loop automatically; set EASYTL_USE_UVLOOP=0 to opt out.
+
         Please see the documentation for the specific translation function for the service you want to use.
 
         DeepL: deepl_translate_async()
@@ -1499,25 +2796,12 @@ class EasyTL:
 
         """
 
-        assert service in ["deepl", "openai", "gemini", "google translate", "anthropic", "azure"], InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
+        _translate_fn = _TRANSLATE_ASYNC_DISPATCH.get(service)
 
-        if(service == "deepl"):
-            return await EasyTL.deepl_translate_async(text, **kwargs)
+        if(_translate_fn is None):
+            raise InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
 
-        elif(service == "openai"):
-            return await EasyTL.openai_translate_async(text, **kwargs)
-
-        elif(service == "gemini"):
-            return await EasyTL.gemini_translate_async(text, **kwargs)
-        
-        elif(service == "google translate"):
-            return await EasyTL.googletl_translate_async(text, **kwargs)
-        
-        elif(service == "anthropic"):
-            return await EasyTL.anthropic_translate_async(text, **kwargs)
-        
-        elif(service == "azure"):
-            return await EasyTL.azure_translate_async(text, **kwargs)
+        return await _translate_fn(text, **kwargs)
 
 ##-------------------start-of-calculate_cost()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         
@@ -1554,22 +2838,39 @@ class EasyTL:
 
         """
 
-        assert service in ["deepl", "openai", "gemini", "google translate", "anthropic", "azure"], InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
-
-        if(service == "deepl"):
-            return DeepLService._calculate_cost(text)
-        
-        elif(service == "openai"):
-            return OpenAIService._calculate_cost(text, translation_instructions, model)
-
-        elif(service == "gemini"):
-            return GeminiService._calculate_cost(text, translation_instructions, model)
-        
-        elif(service == "google translate"):
-            return GoogleTLService._calculate_cost(text)
-        
-        elif(service == "anthropic"):
-            return AnthropicService._calculate_cost(text, translation_instructions, model)
-        
-        elif(service == "azure"):
-            return AzureService._calculate_cost(text)
\ No newline at end of file
+        _cost_fn = _CALCULATE_COST_DISPATCH.get(service)
+
+        if(_cost_fn is None):
+            raise InvalidAPITypeException("Invalid service specified. Must be 'deepl', 'openai', 'gemini', 'google translate', 'anthropic' or 'azure'.")
+
+        return _cost_fn(text, translation_instructions, model)
+
+## dispatch tables for the generic entry points, a dict lookup per call instead of a six-way elif ladder of string comparisons
+## defined after the class body because they reference its staticmethods
+_TRANSLATE_DISPATCH:typing.Dict[str, typing.Callable] = {
+    "deepl": EasyTL.deepl_translate,
+    "openai": EasyTL.openai_translate,
+    "gemini": EasyTL.gemini_translate,
+    "google translate": EasyTL.googletl_translate,
+    "anthropic": EasyTL.anthropic_translate,
+    "azure": EasyTL.azure_translate,
+}
+
+_TRANSLATE_ASYNC_DISPATCH:typing.Dict[str, typing.Callable] = {
+    "deepl": EasyTL.deepl_translate_async,
+    "openai": EasyTL.openai_translate_async,
+    "gemini": EasyTL.gemini_translate_async,
+    "google translate": EasyTL.googletl_translate_async,
+    "anthropic": EasyTL.anthropic_translate_async,
+    "azure": EasyTL.azure_translate_async,
+}
+
+## the character-priced services ignore instructions and model, lambdas normalize the signatures so calculate_cost can dispatch uniformly
+_CALCULATE_COST_DISPATCH:typing.Dict[str, typing.Callable] = {
+    "deepl": lambda text, translation_instructions, model: DeepLService._calculate_cost(text),
+    "openai": lambda text, translation_instructions, model: OpenAIService._calculate_cost(text, translation_instructions, model),
+    "gemini": lambda text, translation_instructions, model: GeminiService._calculate_cost(text, translation_instructions, model),
+    "google translate": lambda text, translation_instructions, model: GoogleTLService._calculate_cost(text),
+    "anthropic": lambda text, translation_instructions, model: AnthropicService._calculate_cost(text, translation_instructions, model),
+    "azure": lambda text, translation_instructions, model: AzureService._calculate_cost(text),
+}
\ No newline at end of file
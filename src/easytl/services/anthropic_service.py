@@ -7,6 +7,8 @@ import typing
 import asyncio
 
 ## third-party imports
+import httpx
+
 from anthropic import Anthropic, AsyncAnthropic
 
 ## custom modules
@@ -14,7 +16,7 @@ from ..exceptions import EasyTLException
 from ..classes import ModelTranslationMessage, NotGiven, NOT_GIVEN, AnthropicMessage, AnthropicToolsBetaMessage
 from ..decorators import _sync_logging_decorator, _async_logging_decorator
 
-from ..util.util import _is_iterable_of_strings, _convert_iterable_to_str, _estimate_cost
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _is_iterable_of_strings, _convert_iterable_to_str, _estimate_cost, _HTTP2_AVAILABLE
 from ..util.constants import VALID_JSON_ANTHROPIC_MODELS
 
 
@@ -34,15 +36,34 @@ class AnthropicService:
     _max_tokens:int | NotGiven = NOT_GIVEN
 
     _semaphore_value:int = 5
-    _semaphore:asyncio.Semaphore = asyncio.Semaphore(_semaphore_value)
+
+    ## semaphores keyed per event loop, created lazily on first use inside the running loop
+    ## a semaphore first awaited on one loop cannot safely gate tasks on another (e.g. across repeated asyncio.run() calls)
+    _semaphores:typing.Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    ## explicitly sized connection pool for the async client, large fan-outs then reuse keep-alive connections instead of paying a TLS handshake per request (httpx ships with the SDK)
+    _http_client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0), timeout=httpx.Timeout(60.0))
 
     _sync_client = Anthropic(api_key="DummyKey")
-    _async_client = AsyncAnthropic(api_key="DummyKey")
+    _async_client = AsyncAnthropic(api_key="DummyKey", http_client=_http_client)
 
     _rate_limit_delay:float | None = None
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
+    ## signature of the settings that were last applied, so _set_attributes() can skip the rebuild when nothing changed
+    _last_settings_sig:typing.Tuple | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated core translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+
     _log_directory:str | None = None
 
     _json_mode:bool = False
@@ -99,6 +120,7 @@ class AnthropicService:
                         logging_directory:str | None=None,
                         semaphore:int | None=None,
                         rate_limit_delay:float | None=None,
+                        rate_limit_burst:int = 1,
                         json_mode:bool=False,
                         response_schema:typing.Mapping[str, typing.Any] | None = None
                         ) -> None:
@@ -109,6 +131,15 @@ class AnthropicService:
     
             """
     
+            ## translate functions call this on every invocation with override_previous_settings=True, so identical settings short-circuit and keep the warm client state and cached decorated callables untouched
+            _settings_sig = (model, system, temperature, top_p, top_k, stream,
+                             tuple(stop_sequences) if isinstance(stop_sequences, list) else stop_sequences,
+                             max_tokens, decorator, logging_directory, semaphore,
+                             rate_limit_delay, rate_limit_burst, json_mode, response_schema)
+
+            if(_settings_sig == AnthropicService._last_settings_sig):
+                return
+
             AnthropicService._model = model
             AnthropicService._system = system
             AnthropicService._temperature = temperature
@@ -120,9 +151,19 @@ class AnthropicService:
 
             AnthropicService._decorator_to_use = decorator
 
+            if(decorator is not None):
+                AnthropicService._decorated_translate_text = _apply_decorator(decorator, AnthropicService.__translate_text)
+                AnthropicService._decorated_translate_text_async = _apply_decorator(decorator, AnthropicService.__translate_text_async)
+
+            else:
+                AnthropicService._decorated_translate_text = None
+                AnthropicService._decorated_translate_text_async = None
+
             AnthropicService._log_directory = logging_directory
 
             AnthropicService._rate_limit_delay = rate_limit_delay
+            AnthropicService._rate_limit_burst = rate_limit_burst
+            AnthropicService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
 
             AnthropicService._json_mode = json_mode
             AnthropicService._response_schema = response_schema
@@ -137,9 +178,10 @@ class AnthropicService:
                 AnthropicService._sync_client.max_retries = 2
                 AnthropicService._async_client.max_retries = 2
             
-            if(semaphore is not None):
+            ## existing per-loop semaphores stay put unless the value changed, replacing them would orphan tasks already waiting on the old ones
+            if(semaphore is not None and semaphore != AnthropicService._semaphore_value):
                 AnthropicService._semaphore_value = semaphore
-                AnthropicService._semaphore = asyncio.Semaphore(AnthropicService._semaphore_value)
+                AnthropicService._semaphores.clear()
 
             if(AnthropicService._json_mode and AnthropicService._model in VALID_JSON_ANTHROPIC_MODELS):
                 AnthropicService._default_translation_instructions = "Please translate the following text into English. Make sure to use the translate tool to return the text in a valid JSON format."
@@ -151,6 +193,9 @@ class AnthropicService:
             else:
                 AnthropicService._default_translation_instructions = "Please translate the following text into English."
 
+            ## recorded only once everything applied cleanly, a raise above leaves the signature unset so the next call retries
+            AnthropicService._last_settings_sig = _settings_sig
+
 ##-------------------start-of-_build_translation_batches()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -210,12 +255,42 @@ class AnthropicService:
         if(translation_instructions is None):
             translation_instructions = AnthropicService._default_translation_instructions
 
-        if(AnthropicService._decorator_to_use is None):
+        if(AnthropicService._decorated_translate_text is None):
             return AnthropicService.__translate_text(translation_instructions, translation_prompt)
 
-        decorated_function = AnthropicService._decorator_to_use(AnthropicService.__translate_text)
-        return decorated_function(translation_instructions, translation_prompt)
+        return AnthropicService._decorated_translate_text(translation_instructions, translation_prompt)
     
+##-------------------start-of-_get_semaphore()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_semaphore() -> asyncio.Semaphore:
+
+        """
+
+        Returns the semaphore for the running event loop, creating it with the current value if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a semaphore whose waiters it owns.
+
+        Returns:
+        semaphore (asyncio.Semaphore) : The semaphore for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _semaphore = AnthropicService._semaphores.get(_loop)
+
+        if(_semaphore is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in AnthropicService._semaphores if _l.is_closed()]:
+                del AnthropicService._semaphores[_stale_loop]
+
+            _semaphore = asyncio.Semaphore(AnthropicService._semaphore_value)
+            AnthropicService._semaphores[_loop] = _semaphore
+
+        return _semaphore
+
 ##-------------------start-of-_translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -240,11 +315,10 @@ class AnthropicService:
         if(translation_instructions is None):
             translation_instructions = AnthropicService._default_translation_instructions
 
-        if(AnthropicService._decorator_to_use is None):
+        if(AnthropicService._decorated_translate_text_async is None):
             return await AnthropicService.__translate_text_async(translation_instructions, translation_prompt)
-        
-        decorated_function = AnthropicService._decorator_to_use(AnthropicService.__translate_text_async)
-        return await decorated_function(translation_instructions, translation_prompt)
+
+        return await AnthropicService._decorated_translate_text_async(translation_instructions, translation_prompt)
 
 ##-------------------start-of-_translate_message()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -304,10 +378,10 @@ class AnthropicService:
 
         """
 
-        async with AnthropicService._semaphore:
+        async with AnthropicService._get_semaphore():
 
-            if(AnthropicService._rate_limit_delay is not None):
-                await asyncio.sleep(AnthropicService._rate_limit_delay)
+            if(AnthropicService._rate_limiter is not None):
+                await AnthropicService._rate_limiter._acquire()
 
             attributes = ["temperature", "top_p", "top_k", "stream", "stop_sequences", "max_tokens"]
             message_args = {
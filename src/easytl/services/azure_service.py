@@ -9,10 +9,20 @@ import uuid
 import time
 
 # third-party libraries
+import httpx
 import requests
 
+## orjson parses in C and releases the GIL, worthwhile on large batched responses, but strictly optional
+try:
+    import orjson # type: ignore
+    _loads = orjson.loads
+
+except ImportError:
+    import json
+    _loads = json.loads
+
 ## custom modules
-from ..util.util import _convert_iterable_to_str
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _convert_iterable_to_str, _HTTP2_AVAILABLE
 from ..decorators import _async_logging_decorator, _sync_logging_decorator
 
 class AzureService:
@@ -35,8 +45,31 @@ class AzureService:
 
     _rate_limit_delay:float | None = None
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_batch:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_batch_async:typing.Union[typing.Callable, None] = None
+
+    ## shared session so repeated requests reuse the same TLS connection instead of handshaking per call, created lazily on first use
+    _session:requests.Session | None = None
+
+    ## responses already fetched this process, keyed by (source_lang, target_lang, text), repeat strings skip the network round-trip entirely
+    ## cleared via EasyTL.clear_cache()
+    _translation_cache:typing.Dict[typing.Tuple[typing.Union[str, None], str, str], typing.Any] = {}
+
+    ## async counterpart of _session, pooled httpx clients so concurrent translations reuse keep-alive connections instead of handshaking per request
+    ## keyed per event loop, the pooled connections belong to the loop that created them and reusing them after that loop closes (e.g. across repeated asyncio.run() calls) raises "Event loop is closed"
+    _async_clients:typing.Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
     _log_directory:str | None = None
 
 ##-------------------start-of-_set_api_key()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -65,7 +98,8 @@ class AzureService:
                         decorator:typing.Callable | None = None,
                         log_directory:str | None = None,
                         semaphore:int | None = None,
-                        rate_limit_delay:float | None = None
+                        rate_limit_delay:float | None = None,
+                        rate_limit_burst:int = 1
                         ) -> None:
         """
 
@@ -83,6 +117,19 @@ class AzureService:
 
         ## Service Attributes
         AzureService._decorator_to_use = decorator
+
+        if(decorator is not None):
+            AzureService._decorated_translate_text = _apply_decorator(decorator, AzureService._translate_text)
+            AzureService._decorated_translate_text_async = _apply_decorator(decorator, AzureService._translate_text_async)
+            AzureService._decorated_translate_text_batch = _apply_decorator(decorator, AzureService._translate_text_batch)
+            AzureService._decorated_translate_text_batch_async = _apply_decorator(decorator, AzureService._translate_text_batch_async)
+
+        else:
+            AzureService._decorated_translate_text = None
+            AzureService._decorated_translate_text_async = None
+            AzureService._decorated_translate_text_batch = None
+            AzureService._decorated_translate_text_batch_async = None
+
         AzureService._log_directory = log_directory
 
         if(semaphore is not None):
@@ -90,6 +137,8 @@ class AzureService:
             AzureService._semaphore = asyncio.Semaphore(semaphore)
 
         AzureService._rate_limit_delay = rate_limit_delay
+        AzureService._rate_limit_burst = rate_limit_burst
+        AzureService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
 
 ##-------------------start-of-_prepare_translation_parameters()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------   
 
@@ -116,7 +165,61 @@ class AzureService:
         }
 
         return params, headers
-    
+
+##-------------------start-of-_get_session()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_session() -> requests.Session:
+
+        """
+
+        Returns the shared requests session, creating it if it doesn't exist yet.
+
+        Returns:
+        session (requests.Session) : The shared session.
+
+        """
+
+        if(AzureService._session is None):
+            AzureService._session = requests.Session()
+
+        return AzureService._session
+
+##-------------------start-of-_get_async_client()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_async_client() -> httpx.AsyncClient:
+
+        """
+
+        Returns the shared httpx client for the running event loop, creating it if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a client whose connections it owns.
+
+        Returns:
+        client (httpx.AsyncClient) : The shared client for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _client = AzureService._async_clients.get(_loop)
+
+        if(_client is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in AzureService._async_clients if _l.is_closed()]:
+                del AzureService._async_clients[_stale_loop]
+
+            ## HTTP/2 multiplexes the whole fan-out over a handful of connections when the optional h2 package is installed
+            _client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE,
+                                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                                        timeout=httpx.Timeout(30.0))
+
+            AzureService._async_clients[_loop] = _client
+
+        return _client
+
 ##-------------------start-of-_translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -148,14 +251,18 @@ class AzureService:
 
             url = AzureService._endpoint + AzureService._path
 
-            request = requests.post(url, params=params, headers=headers, json=body)
-            response = request.json()
+            request = AzureService._get_session().post(url, params=params, headers=headers, json=body)
+
+            ## error statuses (401, 429, ...) come back as JSON bodies too, raising here keeps them out of the response cache and lets retry decorators see the failure
+            request.raise_for_status()
+
+            response = _loads(request.content)
 
             return response
 
         except Exception as _e:
             raise _e
-        
+
 ##-------------------start-of-_translate_text_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -176,12 +283,114 @@ class AzureService:
 
         async with AzureService._semaphore:
 
-            if(AzureService._rate_limit_delay is not None):
-                await asyncio.sleep(AzureService._rate_limit_delay)
+            if(AzureService._rate_limiter is not None):
+                await AzureService._rate_limiter._acquire()
+
+            params, headers = AzureService._prepare_translation_parameters()
+
+            body = [{
+                'text': text
+            }]
+
+            url = AzureService._endpoint + AzureService._path
+
+            ## a real async request through the pooled client, previously this shipped the sync call off to a worker thread which tied up an executor slot per in-flight request
+            request = await AzureService._get_async_client().post(url, params=params, headers=headers, json=body)
+
+            ## error statuses (401, 429, ...) come back as JSON bodies too, raising here keeps them out of the response cache and lets retry decorators see the failure
+            request.raise_for_status()
 
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, lambda: AzureService._translate_text(text))
+            response = _loads(request.content)
+
+            return response
             
+##-------------------start-of-_translate_text_batch()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    @_sync_logging_decorator
+    def _translate_text_batch(texts:typing.List[str]) -> typing.Union[typing.List[typing.Any], typing.Any]:
+
+        """
+
+        Translates several texts in one request using the Azure service.
+
+        The /translate endpoint accepts up to 100 entries per call, so one round-trip covers the whole chunk.
+
+        Parameters:
+        texts (list[str]): The texts to translate.
+
+        Returns:
+        response (list): The list of per-text response entries, one per input, in input order.
+
+        """
+
+        if(AzureService._rate_limit_delay is not None):
+            time.sleep(AzureService._rate_limit_delay)
+
+        params, headers = AzureService._prepare_translation_parameters()
+
+        try:
+
+            body = [{
+                'text': _text
+            } for _text in texts]
+
+            url = AzureService._endpoint + AzureService._path
+
+            request = AzureService._get_session().post(url, params=params, headers=headers, json=body)
+
+            ## error statuses (401, 429, ...) come back as JSON bodies too, raising here keeps them out of the response cache and lets retry decorators see the failure
+            request.raise_for_status()
+
+            response = _loads(request.content)
+
+            return response
+
+        except Exception as _e:
+            raise _e
+
+##-------------------start-of-_translate_text_batch_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    @_async_logging_decorator
+    async def _translate_text_batch_async(texts:typing.List[str]) -> typing.Union[typing.List[typing.Any], typing.Any]:
+
+        """
+
+        Translates several texts in one request using the Azure service asynchronously.
+
+        The /translate endpoint accepts up to 100 entries per call, so one round-trip covers the whole chunk.
+
+        Parameters:
+        texts (list[str]): The texts to translate.
+
+        Returns:
+        response (list): The list of per-text response entries, one per input, in input order.
+
+        """
+
+        async with AzureService._semaphore:
+
+            if(AzureService._rate_limiter is not None):
+                await AzureService._rate_limiter._acquire()
+
+            params, headers = AzureService._prepare_translation_parameters()
+
+            body = [{
+                'text': _text
+            } for _text in texts]
+
+            url = AzureService._endpoint + AzureService._path
+
+            request = await AzureService._get_async_client().post(url, params=params, headers=headers, json=body)
+
+            ## error statuses (401, 429, ...) come back as JSON bodies too, raising here keeps them out of the response cache and lets retry decorators see the failure
+            request.raise_for_status()
+
+            response = _loads(request.content)
+
+            return response
+
 ##-------------------start-of-_test_credentials()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
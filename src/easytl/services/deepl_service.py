@@ -15,7 +15,7 @@ import deepl
 
 ## custom modules
 from ..version import VERSION
-from ..util.util import _convert_iterable_to_str
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _convert_iterable_to_str
 from ..decorators import _async_logging_decorator, _sync_logging_decorator
 from ..classes import Language, SplitSentences, Formality, GlossaryInfo, TextResult
 
@@ -39,12 +39,28 @@ class DeepLService:
     _ignore_tags:str | typing.List[str] | None = None
 
     _semaphore_value:int = 15
-    _semaphore:asyncio.Semaphore = asyncio.Semaphore(_semaphore_value)
+
+    ## semaphores keyed per event loop, created lazily on first use inside the running loop
+    ## a semaphore first awaited on one loop cannot safely gate tasks on another (e.g. across repeated asyncio.run() calls)
+    _semaphores:typing.Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
 
     _rate_limit_delay:float | None = None 
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+
+    ## signature of the last applied settings, used to skip redundant _set_attributes() calls
+    _last_settings_sig:typing.Tuple | None = None
+
     _log_directory:str | None = None
 
 ##-------------------start-of-set_attributes()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -65,7 +81,8 @@ class DeepLService:
                         decorator:typing.Callable | None = None,
                         logging_directory:str | None = None,
                         semaphore:int | None = None,
-                        rate_limit_delay:float | None = None
+                        rate_limit_delay:float | None = None,
+                        rate_limit_burst:int = 1
                         ) -> None:
 
         """
@@ -74,6 +91,16 @@ class DeepLService:
 
         """
 
+        ## translate loops call this with identical settings on every iteration, re-applying them (and rebuilding the decorated functions) would be wasted work
+        _settings_sig = (target_lang, source_lang, context, split_sentences,
+                        preserve_formatting, formality, glossary, tag_handling,
+                        outline_detection, non_splitting_tags, splitting_tags,
+                        ignore_tags, decorator, logging_directory, semaphore,
+                        rate_limit_delay, rate_limit_burst)
+
+        if(_settings_sig == DeepLService._last_settings_sig):
+            return
+
         ## API Attributes
 
         DeepLService._target_lang = target_lang
@@ -93,6 +120,14 @@ class DeepLService:
 
         DeepLService._decorator_to_use = decorator
 
+        if(decorator is not None):
+            DeepLService._decorated_translate_text = _apply_decorator(decorator, DeepLService._translate_text)
+            DeepLService._decorated_translate_text_async = _apply_decorator(decorator, DeepLService._translate_text_async)
+
+        else:
+            DeepLService._decorated_translate_text = None
+            DeepLService._decorated_translate_text_async = None
+
         DeepLService._log_directory = logging_directory
 
         ## if a decorator is used, we want to disable retries, otherwise set it to the default value which is 5
@@ -102,11 +137,17 @@ class DeepLService:
         else:
             deepl.http_client.max_network_retries = 5
 
-        if(semaphore is not None):
+        ## existing per-loop semaphores stay put unless the value changed, replacing them would orphan tasks already waiting on the old ones
+        if(semaphore is not None and semaphore != DeepLService._semaphore_value):
             DeepLService._semaphore_value = semaphore
-            DeepLService._semaphore = asyncio.Semaphore(semaphore)
+            DeepLService._semaphores.clear()
 
         DeepLService._rate_limit_delay = rate_limit_delay
+        DeepLService._rate_limit_burst = rate_limit_burst
+        DeepLService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
+
+        ## recorded only once everything above has been applied, so a failure part-way through doesn't leave the skip believing these settings are live
+        DeepLService._last_settings_sig = _settings_sig
 
 ##-------------------start-of-_prepare_translation_parameters()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -176,6 +217,37 @@ class DeepLService:
         except Exception as _e:
             raise _e
         
+##-------------------start-of-_get_semaphore()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_semaphore() -> asyncio.Semaphore:
+
+        """
+
+        Returns the semaphore for the running event loop, creating it with the current value if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a semaphore whose waiters it owns.
+
+        Returns:
+        semaphore (asyncio.Semaphore) : The semaphore for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _semaphore = DeepLService._semaphores.get(_loop)
+
+        if(_semaphore is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in DeepLService._semaphores if _l.is_closed()]:
+                del DeepLService._semaphores[_stale_loop]
+
+            _semaphore = asyncio.Semaphore(DeepLService._semaphore_value)
+            DeepLService._semaphores[_loop] = _semaphore
+
+        return _semaphore
+
 ##-------------------start-of-_translate_text_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         
     @staticmethod
@@ -196,10 +268,10 @@ class DeepLService:
 
         ## decorators need to be applied outside of the function, for reasons detailed in easytl.py
 
-        async with DeepLService._semaphore:
+        async with DeepLService._get_semaphore():
 
-            if(DeepLService._rate_limit_delay is not None):
-                await asyncio.sleep(DeepLService._rate_limit_delay)
+            if(DeepLService._rate_limiter is not None):
+                await DeepLService._rate_limiter._acquire()
 
             params = DeepLService._prepare_translation_parameters(text)
 
@@ -6,16 +6,44 @@
 import typing
 import asyncio
 
+from functools import lru_cache
+
 import google.generativeai as genai
 
 ## custom modules
-from ..util.util import _estimate_cost, _convert_iterable_to_str, _is_iterable_of_strings
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _estimate_cost, _convert_iterable_to_str, _is_iterable_of_strings
 from ..util.constants import VALID_JSON_GEMINI_MODELS as VALID_SYSTEM_MESSAGE_MODELS, VALID_JSON_GEMINI_MODELS
 
 from ..decorators import _async_logging_decorator, _sync_logging_decorator
 from ..classes import GenerationConfig, GenerateContentResponse, AsyncGenerateContentResponse
 from ..exceptions import EasyTLException, InvalidTextInputException
 
+@lru_cache(maxsize=8)
+def _build_generation_config(candidate_count:int,
+                             stop_sequences:typing.Tuple[str, ...] | None,
+                             max_output_tokens:int | None,
+                             temperature:float,
+                             top_p:float,
+                             top_k:int,
+                             response_mime_type:str) -> GenerationConfig:
+
+    """
+
+    Builds a GenerationConfig for the given settings, memoized so callers toggling between a few configs reuse the same objects.
+
+    Schema-less configs only; a response schema is an unhashable mapping, so those are built uncached by _redefine_client().
+
+    """
+
+    return GenerationConfig(candidate_count=candidate_count,
+                            stop_sequences=list(stop_sequences) if stop_sequences is not None else None,
+                            max_output_tokens=max_output_tokens,
+                            temperature=temperature,
+                            top_p=top_p,
+                            top_k=top_k,
+                            response_mime_type=response_mime_type,
+                            response_schema=None)
+
 class GeminiService:
 
     _default_translation_instructions:str = "Please translate the following text into English."
@@ -35,42 +63,61 @@ class GeminiService:
     _client:genai.GenerativeModel
     _generation_config:GenerationConfig
 
+    ## prompt assembly for the current settings, rebuilt by _redefine_client(); models that take a system instruction send the text bare, older ones get the system message prepended
+    _assemble_request:typing.Callable[[str], str] = lambda _t: _t
+
+    ## signature of the settings the client was last built from, so _redefine_client() can skip rebuilding when nothing changed
+    _last_client_sig:typing.Tuple | None = None
+
     _semaphore_value:int = 5
-    _semaphore:asyncio.Semaphore = asyncio.Semaphore(_semaphore_value)
+
+    ## semaphores keyed per event loop, created lazily on first use inside the running loop
+    ## a semaphore first awaited on one loop cannot safely gate tasks on another (e.g. across repeated asyncio.run() calls)
+    _semaphores:typing.Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
 
     _rate_limit_delay:float | None = None
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated core translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+
     _log_directory:str | None = None
 
     ## Set to prevent any blockage of content
-    _safety_settings = [
-        {
-            "category": "HARM_CATEGORY_DANGEROUS",
-            "threshold": "BLOCK_NONE",
-        },
+    ## already in enum form so the SDK's per-call normalization skips the string parsing, and a tuple so the shared settings cannot be mutated in place
+    _safety_settings = tuple(
         {
-            "category": "HARM_CATEGORY_HARASSMENT",
-            "threshold": "BLOCK_NONE",
-        },
-        {
-            "category": "HARM_CATEGORY_HATE_SPEECH",
-            "threshold": "BLOCK_NONE",
-        },
-        {
-            "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-            "threshold": "BLOCK_NONE",
-        },
-        {
-            "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-            "threshold": "BLOCK_NONE",
-        },
-    ]
+            "category": _category,
+            "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE,
+        }
+        for _category in (
+            genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS,
+            genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+            genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+            genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+            genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+        )
+    )
 
     _json_mode:bool = False
     _response_schema:typing.Mapping[str, typing.Any] | None = None
 
+    ## in-flight requests keyed like _translation_cache, concurrent repeats of the same request share one upstream call instead of each paying for their own
+    ## only consulted at temperature 0, where identical inputs are guaranteed identical outputs; entries are removed as soon as the call settles
+    _inflight:typing.Dict[typing.Tuple[str, typing.Union[str, None], bool, typing.Union[int, None], str], asyncio.Future] = {}
+
+    ## responses already fetched this process, keyed by (model, system_message, json_mode, max_output_tokens, text) since each of those shapes the output, repeat requests skip the API call entirely
+    ## like _inflight this only applies at temperature 0; cleared via EasyTL.clear_cache()
+    _translation_cache:typing.Dict[typing.Tuple[str, typing.Union[str, None], bool, typing.Union[int, None], str], typing.Any] = {}
+
 ##-------------------start-of-_set_api_key()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -103,6 +150,7 @@ class GeminiService:
                         logging_directory:str | None=None,
                         semaphore:int | None=None,
                         rate_limit_delay:float | None=None,
+                        rate_limit_burst:int = 1,
                         json_mode:bool=False,
                         response_schema:typing.Mapping[str, typing.Any] | None = None
                         ) -> None:
@@ -125,9 +173,19 @@ class GeminiService:
 
         GeminiService._decorator_to_use = decorator
 
+        if(decorator is not None):
+            GeminiService._decorated_translate_text = _apply_decorator(decorator, GeminiService.__translate_text)
+            GeminiService._decorated_translate_text_async = _apply_decorator(decorator, GeminiService.__translate_text_async)
+
+        else:
+            GeminiService._decorated_translate_text = None
+            GeminiService._decorated_translate_text_async = None
+
         GeminiService._log_directory = logging_directory
 
         GeminiService._rate_limit_delay = rate_limit_delay
+        GeminiService._rate_limit_burst = rate_limit_burst
+        GeminiService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
 
         GeminiService._json_mode = json_mode
         GeminiService._response_schema = response_schema
@@ -141,8 +199,12 @@ class GeminiService:
                             "gemini-1.5-flash-latest": 2,
                             }
         
-        GeminiService._semaphore_value = semaphore or semaphore_values.get(GeminiService._model, 5)
-        GeminiService._semaphore = asyncio.Semaphore(GeminiService._semaphore_value)
+        _new_semaphore_value = semaphore or semaphore_values.get(GeminiService._model, 5)
+
+        ## existing per-loop semaphores stay put unless the value changed, replacing them would orphan tasks already waiting on the old ones
+        if(_new_semaphore_value != GeminiService._semaphore_value):
+            GeminiService._semaphore_value = _new_semaphore_value
+            GeminiService._semaphores.clear()
 
         if(GeminiService._json_mode and GeminiService._model in VALID_JSON_GEMINI_MODELS and response_schema is not None):
             GeminiService._default_translation_instructions = "Please translate the following text into English. Make sure to return the translated text in JSON format. The JSON should be in the format specified in the response schema."
@@ -168,8 +230,21 @@ class GeminiService:
 
         """
 
+        ## this runs before every decorated call, but the client and config only depend on these settings, so identical settings reuse the existing client (and its pooled HTTP session) instead of constructing a fresh one per request
+        _client_sig = (GeminiService._model, GeminiService._system_message,
+                       GeminiService._json_mode, GeminiService._candidate_count,
+                       tuple(GeminiService._stop_sequences) if GeminiService._stop_sequences is not None else None,
+                       GeminiService._max_output_tokens, GeminiService._temperature,
+                       GeminiService._top_p, GeminiService._top_k,
+                       GeminiService._response_schema)
+
+        if(_client_sig == GeminiService._last_client_sig):
+            return
+
+        GeminiService._last_client_sig = _client_sig
+
         response_mime_type = "application/json" if GeminiService._json_mode else "text/plain"
-        
+
         gen_model_params = {
             "model_name": GeminiService._model,
             "safety_settings": GeminiService._safety_settings,
@@ -178,20 +253,38 @@ class GeminiService:
         
         GeminiService._client = genai.GenerativeModel(**gen_model_params)
         
-        generation_config_params = {
-            "candidate_count": GeminiService._candidate_count,
-            "stop_sequences": GeminiService._stop_sequences,
-            "max_output_tokens": GeminiService._max_output_tokens,
-            "temperature": GeminiService._temperature,
-            "top_p": GeminiService._top_p,
-            "top_k": GeminiService._top_k,
-            "response_mime_type": response_mime_type,
-            "response_schema": GeminiService._response_schema if GeminiService._response_schema and GeminiService._json_mode else None
-        }
-        
-        GeminiService._generation_config = GenerationConfig(**generation_config_params)
-        
-        GeminiService._semaphore = asyncio.Semaphore(GeminiService._semaphore_value)
+        _response_schema = GeminiService._response_schema if GeminiService._response_schema and GeminiService._json_mode else None
+
+        if(_response_schema is None):
+
+            ## callers that toggle between a few known configs get the same memoized object back instead of a fresh construction per toggle
+            GeminiService._generation_config = _build_generation_config(GeminiService._candidate_count,
+                                                                        tuple(GeminiService._stop_sequences) if GeminiService._stop_sequences is not None else None,
+                                                                        GeminiService._max_output_tokens,
+                                                                        GeminiService._temperature,
+                                                                        GeminiService._top_p,
+                                                                        GeminiService._top_k,
+                                                                        response_mime_type)
+
+        else:
+
+            ## a response schema is an unhashable mapping, so schema-bearing configs are built uncached
+            GeminiService._generation_config = GenerationConfig(candidate_count=GeminiService._candidate_count,
+                                                                stop_sequences=GeminiService._stop_sequences,
+                                                                max_output_tokens=GeminiService._max_output_tokens,
+                                                                temperature=GeminiService._temperature,
+                                                                top_p=GeminiService._top_p,
+                                                                top_k=GeminiService._top_k,
+                                                                response_mime_type=response_mime_type,
+                                                                response_schema=_response_schema)
+
+        ## the prompt shape only depends on the model and system message, so the branch and the f-string capture are resolved here once per settings change rather than per call
+        if(GeminiService._model in VALID_SYSTEM_MESSAGE_MODELS):
+            GeminiService._assemble_request = lambda _t: _t
+        else:
+            ## the separator is folded into the prefix here, so each call is a single two-string concat rather than f-string formatting
+            GeminiService._assemble_request = lambda _t, _p=f"{GeminiService._system_message}\n": _p + _t
+
 
 ##-------------------start-of-_redefine_client_decorator()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -216,6 +309,37 @@ class GeminiService:
         
         return wrapper
             
+##-------------------start-of-_get_semaphore()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_semaphore() -> asyncio.Semaphore:
+
+        """
+
+        Returns the semaphore for the running event loop, creating it with the current value if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a semaphore whose waiters it owns.
+
+        Returns:
+        semaphore (asyncio.Semaphore) : The semaphore for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _semaphore = GeminiService._semaphores.get(_loop)
+
+        if(_semaphore is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in GeminiService._semaphores if _l.is_closed()]:
+                del GeminiService._semaphores[_stale_loop]
+
+            _semaphore = asyncio.Semaphore(GeminiService._semaphore_value)
+            GeminiService._semaphores[_loop] = _semaphore
+
+        return _semaphore
+
 ##-------------------start-of-_translate_text_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -236,12 +360,82 @@ class GeminiService:
 
         """
 
-        if(GeminiService._decorator_to_use is None):
-            return await GeminiService.__translate_text_async(text_to_translate)
+        _translate = GeminiService._decorated_translate_text_async or GeminiService.__translate_text_async
+
+        ## sampling at nonzero temperature makes repeats legitimately different, so caching and de-duplication only apply to deterministic output
+        if(GeminiService._temperature != 0):
+            return await _translate(text_to_translate)
+
+        _key = (GeminiService._model, GeminiService._system_message, GeminiService._json_mode, GeminiService._max_output_tokens, text_to_translate)
+
+        _cached = GeminiService._translation_cache.get(_key)
+
+        if(_cached is not None):
+            return _cached
 
-        _decorated_function = GeminiService._decorator_to_use(GeminiService.__translate_text_async)
-        return await _decorated_function(text_to_translate)
+        _future = GeminiService._inflight.get(_key)
+
+        if(_future is not None):
+            ## shielded so one caller cancelling doesn't kill the shared call for everyone else awaiting it
+            return await asyncio.shield(_future)
+
+        _future = asyncio.get_running_loop().create_future()
+        GeminiService._inflight[_key] = _future
+
+        try:
+            _response = await _translate(text_to_translate)
+            GeminiService._translation_cache[_key] = _response
+            _future.set_result(_response)
+            return _response
+
+        except Exception as _e:
+            _future.set_exception(_e)
+
+            ## mark the exception as retrieved, otherwise asyncio warns when no duplicate caller happened to be waiting
+            _future.exception()
+
+            raise
+
+        finally:
+            GeminiService._inflight.pop(_key, None)
     
+##-------------------start-of-_translate_text_stream_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    @_redefine_client_decorator
+    async def _translate_text_stream_async(text_to_translate:str) -> typing.AsyncIterator[str]:
+
+        """
+
+        Asynchronously translates text, yielding each piece of the response as the model produces it.
+
+        The first chunk arrives as soon as the model starts generating, long before the full translation is done, so consumers can start processing immediately.
+
+        Parameters:
+        text_to_translate (string) : The text to translate.
+
+        Yields:
+        chunk (string) : The next piece of the translated text as it arrives.
+
+        """
+
+        async with GeminiService._get_semaphore():
+
+            if(GeminiService._rate_limiter is not None):
+                await GeminiService._rate_limiter._acquire()
+
+            text_request = GeminiService._assemble_request(text_to_translate)
+
+            _response = await GeminiService._client.generate_content_async(
+                contents=text_request,
+                generation_config=GeminiService._generation_config,
+                safety_settings=GeminiService._safety_settings,
+                stream=True
+            )
+
+            async for _chunk in _response:
+                yield _chunk.text
+
 ##-------------------start-of-_translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     
     @staticmethod
@@ -262,11 +456,21 @@ class GeminiService:
 
         """
 
-        if(GeminiService._decorator_to_use is None):
-            return GeminiService.__translate_text(text_to_translate)
+        _translate = GeminiService._decorated_translate_text or GeminiService.__translate_text
+
+        ## sampling at nonzero temperature makes repeats legitimately different, so caching only applies to deterministic output
+        if(GeminiService._temperature != 0):
+            return _translate(text_to_translate)
+
+        _key = (GeminiService._model, GeminiService._system_message, GeminiService._json_mode, GeminiService._max_output_tokens, text_to_translate)
+
+        _cached = GeminiService._translation_cache.get(_key)
 
-        _decorated_function = GeminiService._decorator_to_use(GeminiService.__translate_text)
-        return _decorated_function(text_to_translate)
+        if(_cached is None):
+            _cached = _translate(text_to_translate)
+            GeminiService._translation_cache[_key] = _cached
+
+        return _cached
     
 ##-------------------start-of-__translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     
@@ -285,7 +489,7 @@ class GeminiService:
 
         """
 
-        text_request = f"{text_to_translate}" if GeminiService._model in VALID_SYSTEM_MESSAGE_MODELS else f"{GeminiService._system_message}\n{text_to_translate}"
+        text_request = GeminiService._assemble_request(text_to_translate)
 
         _response = GeminiService._client.generate_content(
             contents=text_request,
@@ -313,12 +517,12 @@ class GeminiService:
 
         """
 
-        async with GeminiService._semaphore:
+        async with GeminiService._get_semaphore():
 
-            if(GeminiService._rate_limit_delay is not None):
-                await asyncio.sleep(GeminiService._rate_limit_delay)
+            if(GeminiService._rate_limiter is not None):
+                await GeminiService._rate_limiter._acquire()
 
-            text_request = f"{text_to_translate}" if GeminiService._model in VALID_SYSTEM_MESSAGE_MODELS else f"{GeminiService._system_message}\n{text_to_translate}"
+            text_request = GeminiService._assemble_request(text_to_translate)
 
             _response = await GeminiService._client.generate_content_async(
                 contents=text_request,
@@ -332,7 +536,6 @@ class GeminiService:
 ##-------------------start-of-test_api_key_validity()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     
     @staticmethod
-    @_redefine_client_decorator
     def _test_api_key_validity() -> typing.Tuple[bool, typing.Union[Exception, None]]:
 
         """
@@ -349,11 +552,8 @@ class GeminiService:
 
         try:
 
-            _generation_config = GenerationConfig(candidate_count=1, max_output_tokens=1)
-
-            GeminiService._client.generate_content(
-                "Respond to this with 1",generation_config=_generation_config
-            )
+            ## a metadata round-trip instead of a 1-token generation, validates the key without any token spend or model client build
+            next(iter(genai.list_models()))
 
             _validity = True
 
@@ -365,8 +565,8 @@ class GeminiService:
         
 ##-------------------start-of-_calculate_cost()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
     
+    ## deliberately not behind _redefine_client_decorator, cost estimation is local arithmetic and never touches the client
     @staticmethod
-    @_redefine_client_decorator
     def _calculate_cost(text:str | typing.Iterable, translation_instructions:str | None, model:str | None) -> typing.Tuple[int, float, str]:
 
         """
@@ -388,13 +588,14 @@ class GeminiService:
         if(translation_instructions is None):
             translation_instructions = GeminiService._default_translation_instructions
 
-        if(isinstance(text, typing.Iterable)):
+        _n = 1
+
+        if(isinstance(text, typing.Iterable) and not isinstance(text, str)):
 
-            if(not isinstance(text,str) and not _is_iterable_of_strings(text)):
+            if(not _is_iterable_of_strings(text)):
                 raise InvalidTextInputException("The text must be a string or an iterable of strings.")
 
-            ## since instructions are paired with the text, we need to repeat the instructions for index
-            translation_instructions = translation_instructions * len(text) # type: ignore
+            _n = len(text) # type: ignore
 
             text = _convert_iterable_to_str(text)
 
@@ -406,7 +607,14 @@ class GeminiService:
 
         ## not exactly how the text will be formatted, but it's close enough for the purposes of estimating the cost as tokens should be the same
         total_text_to_estimate = f"{translation_instructions}\n{text}"
-        
+
         _num_tokens, _cost, model = _estimate_cost(total_text_to_estimate, model)
 
-        return _num_tokens, _cost, model  
\ No newline at end of file
+        ## the instructions are sent with every item of an iterable, so their tokens count once per input
+        ## accounted for arithmetically, instead of materializing the instruction string n times into one huge estimate string
+        if(_n > 1):
+            _instr_tokens, _instr_cost, _ = _estimate_cost(translation_instructions, model)
+            _num_tokens += _instr_tokens * (_n - 1)
+            _cost += _instr_cost * (_n - 1)
+
+        return _num_tokens, _cost, model
\ No newline at end of file
@@ -8,6 +8,8 @@ import typing
 import time
 
 ## third-party libraries
+from requests.adapters import HTTPAdapter
+
 from google.cloud import translate_v2 as translate
 from google.cloud.translate_v2 import Client
 
@@ -15,7 +17,7 @@ from google.oauth2 import service_account
 from google.oauth2.service_account import Credentials
 
 ## custom modules
-from ..util.util import _convert_iterable_to_str
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _convert_iterable_to_str
 from ..decorators import _sync_logging_decorator, _async_logging_decorator
 
 class GoogleTLService:
@@ -23,6 +25,9 @@ class GoogleTLService:
     _translator:Client
     _credentials:Credentials
 
+    ## the credentials the client was last built from, so _redefine_client() can skip rebuilding when they haven't changed
+    _client_credentials:Credentials | None = None
+
     ## ISO 639-1 language codes
     _target_lang:str = 'en'
     _source_lang:str | None = None
@@ -30,12 +35,28 @@ class GoogleTLService:
     _format:str = 'text'
 
     _semaphore_value:int = 15
-    _semaphore:asyncio.Semaphore = asyncio.Semaphore(_semaphore_value)
+
+    ## semaphores keyed per event loop, created lazily on first use inside the running loop
+    ## a semaphore first awaited on one loop cannot safely gate tasks on another (e.g. across repeated asyncio.run() calls)
+    _semaphores:typing.Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
 
     _rate_limit_delay:float | None = None
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+
+    ## signature of the last applied settings, used to skip redundant _set_attributes() calls
+    _last_settings_sig:typing.Tuple | None = None
+
     _log_directory:str | None = None
 
 
@@ -64,7 +85,8 @@ class GoogleTLService:
                         decorator:typing.Callable | None = None,
                         logging_directory:str | None = None,
                         semaphore:int | None = None,
-                        rate_limit_delay:float | None = None
+                        rate_limit_delay:float | None = None,
+                        rate_limit_burst:int = 1
                         ) -> None:
 
         """
@@ -73,8 +95,15 @@ class GoogleTLService:
 
         """
 
+        ## translate loops call this with identical settings on every iteration, re-applying them (and rebuilding the decorated functions) would be wasted work
+        _settings_sig = (target_language, format, source_language, decorator,
+                        logging_directory, semaphore, rate_limit_delay, rate_limit_burst)
+
+        if(_settings_sig == GoogleTLService._last_settings_sig):
+            return
+
         ## API Attributes
-    
+
         GoogleTLService._target_lang = target_language
         GoogleTLService._format = format
         GoogleTLService._source_lang = source_language
@@ -83,13 +112,27 @@ class GoogleTLService:
 
         GoogleTLService._decorator_to_use = decorator
 
+        if(decorator is not None):
+            GoogleTLService._decorated_translate_text = _apply_decorator(decorator, GoogleTLService._translate_text)
+            GoogleTLService._decorated_translate_text_async = _apply_decorator(decorator, GoogleTLService._translate_text_async)
+
+        else:
+            GoogleTLService._decorated_translate_text = None
+            GoogleTLService._decorated_translate_text_async = None
+
         GoogleTLService._log_directory = logging_directory
 
-        if(semaphore is not None):
+        ## existing per-loop semaphores stay put unless the value changed, replacing them would orphan tasks already waiting on the old ones
+        if(semaphore is not None and semaphore != GoogleTLService._semaphore_value):
             GoogleTLService._semaphore_value = semaphore
-            GoogleTLService._semaphore = asyncio.Semaphore(semaphore)
+            GoogleTLService._semaphores.clear()
 
         GoogleTLService._rate_limit_delay = rate_limit_delay
+        GoogleTLService._rate_limit_burst = rate_limit_burst
+        GoogleTLService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
+
+        ## recorded only once everything above has been applied, so a failure part-way through doesn't leave the skip believing these settings are live
+        GoogleTLService._last_settings_sig = _settings_sig
 
 ##-------------------start-of-_prepare_translation_parameters()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -125,7 +168,16 @@ class GoogleTLService:
 
         """
 
+        ## reuse the existing client (and its pooled HTTP session) unless the credentials have changed since it was built
+        if(getattr(GoogleTLService, "_translator", None) is not None and GoogleTLService._client_credentials is GoogleTLService._credentials):
+            return
+
         GoogleTLService._translator = translate.Client(credentials=GoogleTLService._credentials)
+        GoogleTLService._client_credentials = GoogleTLService._credentials
+
+        ## the client rides on a requests session whose pool keeps 10 connections by default, fewer than the async fan-out's worker threads,
+        ## so overflow connections were discarded after each request and re-handshaken; size the pool past the default semaphore instead
+        GoogleTLService._translator._http.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=max(32, GoogleTLService._semaphore_value)))
 
 ##-------------------start-of-_redefine_client_decorator()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -182,6 +234,37 @@ class GoogleTLService:
         except Exception as _e:
             raise _e
         
+##-------------------start-of-_get_semaphore()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_semaphore() -> asyncio.Semaphore:
+
+        """
+
+        Returns the semaphore for the running event loop, creating it with the current value if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a semaphore whose waiters it owns.
+
+        Returns:
+        semaphore (asyncio.Semaphore) : The semaphore for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _semaphore = GoogleTLService._semaphores.get(_loop)
+
+        if(_semaphore is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in GoogleTLService._semaphores if _l.is_closed()]:
+                del GoogleTLService._semaphores[_stale_loop]
+
+            _semaphore = asyncio.Semaphore(GoogleTLService._semaphore_value)
+            GoogleTLService._semaphores[_loop] = _semaphore
+
+        return _semaphore
+
 ##-------------------start-of-_translate_text_async()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
         
     @staticmethod
@@ -202,10 +285,10 @@ class GoogleTLService:
 
         ## decorators need to be applied outside of the function for reasons detailed in easytl.py
 
-        async with GoogleTLService._semaphore:
+        async with GoogleTLService._get_semaphore():
 
-            if(GoogleTLService._rate_limit_delay is not None):
-                await asyncio.sleep(GoogleTLService._rate_limit_delay)
+            if(GoogleTLService._rate_limiter is not None):
+                await GoogleTLService._rate_limiter._acquire()
 
             params = GoogleTLService._prepare_translation_parameters(text)
 
@@ -239,7 +322,9 @@ class GoogleTLService:
 
             _response = GoogleTLService._translator.translate('Hello, world!', target_language='ru')
 
-            assert isinstance(_response['translatedText'], str) 
+            ## an explicit raise instead of an assert, since asserts are stripped under python -O
+            if(not isinstance(_response['translatedText'], str)):
+                raise ValueError("Malformed response received from Google Translate.")
 
             _validity = True
 
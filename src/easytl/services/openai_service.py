@@ -7,6 +7,8 @@ import typing
 import asyncio
 
 ## third-party libraries
+import httpx
+
 from openai import AsyncOpenAI, OpenAI
 
 ## custom modules
@@ -14,7 +16,7 @@ from ..classes import SystemTranslationMessage, ModelTranslationMessage, ChatCom
 from ..decorators import _async_logging_decorator, _sync_logging_decorator
 from ..exceptions import EasyTLException
 
-from ..util.util import _convert_iterable_to_str, _estimate_cost, _is_iterable_of_strings
+from ..util.util import _AsyncRateLimiter, _apply_decorator, _convert_iterable_to_str, _estimate_cost, _is_iterable_of_strings, _HTTP2_AVAILABLE
 from ..util.constants import VALID_JSON_OPENAI_MODELS
 
 
@@ -23,6 +25,10 @@ class OpenAIService:
     _default_model:str = "gpt-4"
     _default_translation_instructions:SystemTranslationMessage = SystemTranslationMessage("Please translate the following text into English.")
 
+    ## interned default instruction messages, _set_attributes reuses these instead of allocating a fresh SystemTranslationMessage on every configuration
+    _plain_translation_instructions:SystemTranslationMessage = _default_translation_instructions
+    _json_mode_translation_instructions:SystemTranslationMessage = SystemTranslationMessage("Please translate the following text into English. Make sure to return the translated text in JSON format.")
+
     _system_message:typing.Optional[typing.Union[SystemTranslationMessage, str]] = _default_translation_instructions
 
     _model:str = _default_model
@@ -37,15 +43,34 @@ class OpenAIService:
     _frequency_penalty:float | None | NotGiven = NOT_GIVEN
 
     _semaphore_value:int = 5
-    _semaphore:asyncio.Semaphore = asyncio.Semaphore(_semaphore_value)
+
+    ## semaphores keyed per event loop, created lazily on first use inside the running loop
+    ## a semaphore first awaited on one loop cannot safely gate tasks on another (e.g. across repeated asyncio.run() calls)
+    _semaphores:typing.Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    ## explicitly sized connection pool for the async client, large fan-outs then reuse keep-alive connections instead of paying a TLS handshake per request (httpx ships with the SDK)
+    _http_client = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0), timeout=httpx.Timeout(60.0))
 
     _sync_client = OpenAI(api_key="DummyKey")
-    _async_client = AsyncOpenAI(api_key="DummyKey")
+    _async_client = AsyncOpenAI(api_key="DummyKey", http_client=_http_client)
 
     _rate_limit_delay:float | None = None
 
+    ## extra instantaneous capacity for the limiter, 1 keeps the strict request spacing while larger values let short bursts through before steady-state pacing resumes
+    _rate_limit_burst:int = 1
+
+    ## shared leaky-bucket limiter built from _rate_limit_delay, spaces requests out across concurrent tasks instead of letting them burst
+    _rate_limiter:_AsyncRateLimiter | None = None
+
+    ## signature of the settings that were last applied, so _set_attributes() can skip the rebuild when nothing changed
+    _last_settings_sig:typing.Tuple | None = None
+
     _decorator_to_use:typing.Union[typing.Callable, None] = None
 
+    ## decorated core translate functions, cached so the decorator isn't re-applied on every translate call
+    _decorated_translate_text:typing.Union[typing.Callable, None] = None
+    _decorated_translate_text_async:typing.Union[typing.Callable, None] = None
+
     _log_directory:str | None = None
 
     _json_mode:bool = False
@@ -84,6 +109,7 @@ class OpenAIService:
                         logging_directory:str | None=None,
                         semaphore:int | None=None,
                         rate_limit_delay:float | None=None,
+                        rate_limit_burst:int = 1,
                         json_mode:bool=False
                         ) -> None:
     
@@ -93,6 +119,17 @@ class OpenAIService:
     
             """
     
+            ## translate functions call this on every invocation with override_previous_settings=True, so identical settings short-circuit and keep the warm client state and cached decorated callables untouched
+            _settings_sig = (model, temperature,
+                             tuple(sorted(logit_bias.items())) if isinstance(logit_bias, dict) else logit_bias,
+                             top_p, n, stream,
+                             tuple(stop) if isinstance(stop, list) else stop,
+                             max_tokens, presence_penalty, frequency_penalty,
+                             decorator, logging_directory, semaphore, rate_limit_delay, rate_limit_burst, json_mode)
+
+            if(_settings_sig == OpenAIService._last_settings_sig):
+                return
+
             OpenAIService._model = model
             OpenAIService._temperature = temperature
             OpenAIService._logit_bias = logit_bias
@@ -106,9 +143,19 @@ class OpenAIService:
 
             OpenAIService._decorator_to_use = decorator
 
+            if(decorator is not None):
+                OpenAIService._decorated_translate_text = _apply_decorator(decorator, OpenAIService.__translate_text)
+                OpenAIService._decorated_translate_text_async = _apply_decorator(decorator, OpenAIService.__translate_text_async)
+
+            else:
+                OpenAIService._decorated_translate_text = None
+                OpenAIService._decorated_translate_text_async = None
+
             OpenAIService._log_directory = logging_directory
 
             OpenAIService._rate_limit_delay = rate_limit_delay
+            OpenAIService._rate_limit_burst = rate_limit_burst
+            OpenAIService._rate_limiter = _AsyncRateLimiter(rate_limit_delay, burst=rate_limit_burst) if rate_limit_delay is not None else None
 
             OpenAIService._json_mode = json_mode
 
@@ -120,25 +167,29 @@ class OpenAIService:
                 OpenAIService._sync_client.max_retries = 2
                 OpenAIService._async_client.max_retries = 2
             
-            if(semaphore is not None):
+            ## existing per-loop semaphores stay put unless the value changed, replacing them would orphan tasks already waiting on the old ones
+            if(semaphore is not None and semaphore != OpenAIService._semaphore_value):
                 OpenAIService._semaphore_value = semaphore
-                OpenAIService._semaphore = asyncio.Semaphore(OpenAIService._semaphore_value)
+                OpenAIService._semaphores.clear()
 
             if(OpenAIService._json_mode and OpenAIService._model in VALID_JSON_OPENAI_MODELS):
-                OpenAIService._default_translation_instructions = SystemTranslationMessage("Please translate the following text into English. Make sure to return the translated text in JSON format.")
+                OpenAIService._default_translation_instructions = OpenAIService._json_mode_translation_instructions
 
             elif(OpenAIService._json_mode):
                 model_string = ", ".join(VALID_JSON_OPENAI_MODELS)
                 raise EasyTLException("JSON mode for OpenAI is only available for the following models: " + model_string)
-            
+
             else:
-                OpenAIService._default_translation_instructions = SystemTranslationMessage("Please translate the following text into English.")
+                OpenAIService._default_translation_instructions = OpenAIService._plain_translation_instructions
+
+            ## recorded only once everything applied cleanly, a raise above leaves the signature unset so the next call retries
+            OpenAIService._last_settings_sig = _settings_sig
 
 ##-------------------start-of-_build_translation_batches()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
     def _build_translation_batches(text: typing.Union[str, typing.Iterable[str], ModelTranslationMessage, typing.Iterable[ModelTranslationMessage]],
-                                instructions: typing.Optional[typing.Union[str, SystemTranslationMessage]] = None) -> typing.List[typing.Tuple[ModelTranslationMessage, SystemTranslationMessage]]:
+                                instructions: typing.Optional[typing.Union[str, SystemTranslationMessage]] = None) -> typing.Iterator[typing.Tuple[ModelTranslationMessage, SystemTranslationMessage]]:
         
         """
         
@@ -149,7 +200,7 @@ class OpenAIService:
         instructions (string | SystemTranslationMessage) : The instructions to use for the translation.
 
         Returns:
-        translation_batches (list[tuple[ModelTranslationMessage, SystemTranslationMessage]]) : The translation batches.
+        translation_batches (iterator[tuple[ModelTranslationMessage, SystemTranslationMessage]]) : The translation batches. Lazy, consumers iterate it exactly once.
 
         """
 
@@ -174,7 +225,8 @@ class OpenAIService:
         if(any(not isinstance(item, ModelTranslationMessage) for item in text)):
             raise ValueError("Invalid type in iterable. Must be either strings or ModelTranslationMessage objects.")
         
-        return [(item, instructions) for item in text]
+        ## lazy pairing, validation above stays eager but there's no point materializing N tuples when every consumer iterates exactly once (the single instructions object is shared either way)
+        return ((item, instructions) for item in text)
 
 ##-------------------start-of-_translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -200,12 +252,42 @@ class OpenAIService:
         if(translation_instructions is None):
             translation_instructions = OpenAIService._default_translation_instructions
 
-        if(OpenAIService._decorator_to_use is None):
+        if(OpenAIService._decorated_translate_text is None):
             return OpenAIService.__translate_text(translation_instructions, translation_prompt)
 
-        decorated_function = OpenAIService._decorator_to_use(OpenAIService.__translate_text)
-        return decorated_function(translation_instructions, translation_prompt)
+        return OpenAIService._decorated_translate_text(translation_instructions, translation_prompt)
     
+##-------------------start-of-_get_semaphore()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_semaphore() -> asyncio.Semaphore:
+
+        """
+
+        Returns the semaphore for the running event loop, creating it with the current value if it doesn't exist yet.
+
+        Created lazily inside the running loop rather than at import, so each loop gets a semaphore whose waiters it owns.
+
+        Returns:
+        semaphore (asyncio.Semaphore) : The semaphore for the running loop.
+
+        """
+
+        _loop = asyncio.get_running_loop()
+
+        _semaphore = OpenAIService._semaphores.get(_loop)
+
+        if(_semaphore is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow across repeated asyncio.run() calls
+            for _stale_loop in [_l for _l in OpenAIService._semaphores if _l.is_closed()]:
+                del OpenAIService._semaphores[_stale_loop]
+
+            _semaphore = asyncio.Semaphore(OpenAIService._semaphore_value)
+            OpenAIService._semaphores[_loop] = _semaphore
+
+        return _semaphore
+
 ##-------------------start-of-_translate_text()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
@@ -230,11 +312,10 @@ class OpenAIService:
         if(translation_instructions is None):
             translation_instructions = OpenAIService._default_translation_instructions
 
-        if(OpenAIService._decorator_to_use is None):
+        if(OpenAIService._decorated_translate_text_async is None):
             return await OpenAIService.__translate_text_async(translation_instructions, translation_prompt)
-        
-        decorated_function = OpenAIService._decorator_to_use(OpenAIService.__translate_text_async)
-        return await decorated_function(translation_instructions, translation_prompt)
+
+        return await OpenAIService._decorated_translate_text_async(translation_instructions, translation_prompt)
 
 ##-------------------start-of-_translate_message()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -287,12 +368,12 @@ class OpenAIService:
 
         """
 
-        async with OpenAIService._semaphore:
+        async with OpenAIService._get_semaphore():
 
             response_format = "json_object" if OpenAIService._json_mode and OpenAIService._model in VALID_JSON_OPENAI_MODELS else "text"
 
-            if(OpenAIService._rate_limit_delay is not None):
-                await asyncio.sleep(OpenAIService._rate_limit_delay)
+            if(OpenAIService._rate_limiter is not None):
+                await OpenAIService._rate_limiter._acquire()
 
             attributes = ["temperature", "logit_bias", "top_p", "n", "stream", "stop", "presence_penalty", "frequency_penalty", "max_tokens"]
             message_args = {
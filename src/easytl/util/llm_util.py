@@ -6,17 +6,18 @@
 import json
 import logging
 import typing
-
-## third-party libraries
-import tiktoken
+from functools import lru_cache
 
 ## custom modules
 from ..util.constants import ALLOWED_OPENAI_MODELS, ALLOWED_GEMINI_MODELS, ALLOWED_ANTHROPIC_MODELS, MODEL_MAX_TOKENS
-from ..util.util import _convert_iterable_to_str, _convert_to_correct_type, _update_model_name
+from ..util.util import _convert_iterable_to_str, _convert_to_correct_type, _update_model_name, _get_encoding, _token_count
 
 from ..exceptions import InvalidEasyTLSettingsException, TooManyInputTokensException
 from ..classes import ModelTranslationMessage, NotGiven, NOT_GIVEN
 
+## settings combos that already passed validation, keyed by their frozen items, validation is pure so identical settings never need re-checking
+_validated_settings_cache:set = set()
+
 ##-------------------start-of-_return_curated_anthropic_settings()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
 def _return_curated_anthropic_settings(local_settings:dict[str, typing.Any]) -> dict:
@@ -38,12 +39,12 @@ def _return_curated_anthropic_settings(local_settings:dict[str, typing.Any]) ->
     "anthropic_max_output_tokens": "",
     }
 
-    _non_anthropic_params = ["text", "override_previous_settings", "decorator", "translation_instructions", "logging_directory", "response_type", "semaphore", "translation_delay"]
-    _custom_validation_params = ["anthropic_stop_sequences", "anthropic_response_schema"]
+    ## validated separately, so they skip the generic type conversion
+    _custom_validation_params = ("anthropic_stop_sequences", "anthropic_response_schema")
 
     for _key in _settings.keys():
         param_name = _key.replace("anthropic_", "")
-        if(param_name in local_settings and _key not in _non_anthropic_params and _key not in _custom_validation_params):
+        if(param_name in local_settings and _key not in _custom_validation_params):
             _settings[_key] = _convert_to_correct_type(_key, local_settings[param_name])
 
     return _settings
@@ -69,12 +70,12 @@ def _return_curated_gemini_settings(local_settings:dict[str, typing.Any]) -> dic
     "gemini_max_output_tokens": ""
     }
 
-    _non_gemini_params = ["text", "override_previous_settings", "decorator", "translation_instructions", "logging_directory", "response_type", "semaphore", "translation_delay"]
-    _custom_validation_params = ["gemini_stop_sequences", "gemini_response_schema"]
+    ## validated separately, so they skip the generic type conversion
+    _custom_validation_params = ("gemini_stop_sequences", "gemini_response_schema")
 
     for _key in _settings.keys():
         param_name = _key.replace("gemini_", "")
-        if(param_name in local_settings and _key not in _non_gemini_params and _key not in _custom_validation_params):
+        if(param_name in local_settings and _key not in _custom_validation_params):
             _settings[_key] = _convert_to_correct_type(_key, local_settings[param_name])
 
     return _settings
@@ -101,12 +102,12 @@ def _return_curated_openai_settings(local_settings:dict[str, typing.Any]) -> dic
         "openai_frequency_penalty": ""
         }
 
-        _non_openai_params = ["text", "override_previous_settings", "decorator", "translation_instructions", "logging_directory", "response_type", "response_schema", "semaphore", "translation_delay"]
-        _custom_validation_params = ["openai_stop"]
+        ## validated separately, so it skips the generic type conversion
+        _custom_validation_params = ("openai_stop",)
 
         for _key in _settings.keys():
             param_name = _key.replace("openai_", "")
-            if(param_name in local_settings and _key not in _non_openai_params and _key not in _custom_validation_params):
+            if(param_name in local_settings and _key not in _custom_validation_params):
                 _settings[_key] = _convert_to_correct_type(_key, local_settings[param_name])
 
         return _settings
@@ -115,7 +116,16 @@ def _return_curated_openai_settings(local_settings:dict[str, typing.Any]) -> dic
 
 def _validate_stop_sequences(stop_sequences:typing.List[str] | None | NotGiven) -> None:
 
-    assert stop_sequences in [None, NOT_GIVEN] or isinstance(stop_sequences, str) or (hasattr(stop_sequences, '__iter__') and all(isinstance(i, str) for i in stop_sequences)), InvalidEasyTLSettingsException("Invalid stop sequences. Must be a string or a list of strings.") # type: ignore
+    ## an explicit raise instead of an assert, the assert built the exception object on every call even when it passed and was stripped entirely under python -O
+    if(not (stop_sequences in [None, NOT_GIVEN] or isinstance(stop_sequences, str) or (hasattr(stop_sequences, '__iter__') and all(isinstance(i, str) for i in stop_sequences)))): # type: ignore
+        raise InvalidEasyTLSettingsException("Invalid stop sequences. Must be a string or a list of strings.")
+
+##-------------------start-of-_validate_response_schema()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=128)
+def _parse_response_schema_string(response_schema:str) -> typing.Mapping[str, typing.Any]:
+
+    return json.loads(response_schema)
 
 ##-------------------start-of-_validate_response_schema()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -126,7 +136,8 @@ def _validate_response_schema(response_schema:str | typing.Mapping[str, typing.A
 
     if(isinstance(response_schema, str)):
         try:
-            return json.loads(response_schema)
+            ## parsing is memoized, callers tend to pass the same schema string on every call of a translate loop
+            return _parse_response_schema_string(response_schema)
         except json.JSONDecodeError:
             raise InvalidEasyTLSettingsException("Invalid response_schema. Must be a valid JSON string or None.")
 
@@ -169,8 +180,7 @@ def _validate_text_length(text:str | typing.Iterable[str] | ModelTranslationMess
             ## this just gets the latest model if they passed in a generic model name
             model = _update_model_name(model)
             
-            _encoding = tiktoken.encoding_for_model(model)
-            _num_tokens = len(_encoding.encode(text))
+            _num_tokens = _token_count(model, text)
 
             _max_tokens_allowed = MODEL_MAX_TOKENS.get(model, {}).get("max_input_tokens")
 
@@ -183,8 +193,7 @@ def _validate_text_length(text:str | typing.Iterable[str] | ModelTranslationMess
                 raise TooManyInputTokensException(f"Input text exceeds the maximum token limit of {model}.")
             
         else:
-            _encoding = tiktoken.encoding_for_model("gpt-4-turbo-2024-04-09")
-            _num_tokens = len(_encoding.encode(text))
+            _num_tokens = _token_count("gpt-4-turbo-2024-04-09", text)
 
             _max_tokens_allowed = MODEL_MAX_TOKENS.get(model, {}).get("max_input_tokens")
 
@@ -224,6 +233,16 @@ def _validate_easytl_llm_translation_settings(settings:dict, type:typing.Literal
 
     ## The exception is openai_stop, and gemini_stop_sequences, which aren't validated here, rather in easytl.py, but still used and given to the model.
 
+    ## translate loops pass the same settings on every call, so combos that already passed are skipped (unhashable values just fall through to a full validation)
+    try:
+        _cache_key = (type, frozenset(settings.items()))
+
+    except TypeError:
+        _cache_key = None
+
+    if(_cache_key is not None and _cache_key in _validated_settings_cache):
+        return
+
     _openai_keys = [
         "openai_model",
         "openai_temperature",
@@ -285,7 +304,8 @@ def _validate_easytl_llm_translation_settings(settings:dict, type:typing.Literal
 
 
             ## ensure all keys are present
-            assert all(_key in settings for _key in _openai_keys)
+            if(not all(_key in settings for _key in _openai_keys)):
+                raise ValueError(f"Missing required openai settings keys.")
 
             ## validate each _key using the validation rules
             for _key, _validate in _validation_rules.items():
@@ -299,7 +319,8 @@ def _validate_easytl_llm_translation_settings(settings:dict, type:typing.Literal
         elif(type == "gemini"):
 
             ## ensure all keys are present
-            assert all(_key in settings for _key in _gemini_keys)
+            if(not all(_key in settings for _key in _gemini_keys)):
+                raise ValueError(f"Missing required gemini settings keys.")
 
             ## _validate each _key using the validation rules
             for _key, _validate in _validation_rules.items():
@@ -312,7 +333,8 @@ def _validate_easytl_llm_translation_settings(settings:dict, type:typing.Literal
         elif(type == "anthropic"):
 
             ## ensure all keys are present
-            assert all(_key in settings for _key in _anthropic_keys)
+            if(not all(_key in settings for _key in _anthropic_keys)):
+                raise ValueError(f"Missing required anthropic settings keys.")
 
             ## _validate each _key using the validation rules
             for _key, _validate in _validation_rules.items():
@@ -320,4 +342,7 @@ def _validate_easytl_llm_translation_settings(settings:dict, type:typing.Literal
                     raise ValueError(f"Invalid _value for {_key}")
         
     except Exception as e:
-        raise InvalidEasyTLSettingsException(f"Invalid settings, Due to: {str(e)}")
\ No newline at end of file
+        raise InvalidEasyTLSettingsException(f"Invalid settings, Due to: {str(e)}")
+
+    if(_cache_key is not None):
+        _validated_settings_cache.add(_cache_key)
\ No newline at end of file
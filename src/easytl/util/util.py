@@ -3,10 +3,12 @@
 ## license that can be found in the LICENSE file.
 
 ## built-in libraries
+import asyncio
+import time
 import typing
+from functools import lru_cache
 
 ## third-party libraries
-import tiktoken
 import google.generativeai as genai
 
 ## custom modules
@@ -14,12 +16,109 @@ from .constants import ALLOWED_OPENAI_MODELS, ALLOWED_GEMINI_MODELS, ALLOWED_ANT
 
 from ..classes import NotGiven, NOT_GIVEN
 
+## whether the optional h2 package is importable, httpx only multiplexes requests over HTTP/2 when it is
+try:
+    import h2 # type: ignore
+    _HTTP2_AVAILABLE:bool = True
+
+except ImportError:
+    _HTTP2_AVAILABLE:bool = False
+
+
+##-------------------start-of-_AsyncRateLimiter---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class _AsyncRateLimiter:
+
+    """
+
+    A minimal token-bucket rate limiter for the async translation paths.
+
+    Spaces acquisitions `period` seconds apart across ALL concurrent tasks, unlike a per-task sleep, which lets every waiting task fire at once when its own sleep expires and slams the endpoint in bursts.
+
+    `burst` tokens accumulate while the limiter sits idle, so after a quiet spell that many requests fire immediately before the pacing kicks back in. The default of 1 keeps strict spacing.
+
+    """
+
+    def __init__(self, period:float, burst:int = 1):
+
+        self._period = period
+        self._burst = max(1, burst)
+
+        ## locks keyed per event loop, an asyncio.Lock that ever waited on one loop cannot be awaited on another,
+        ## and a limiter can outlive the loop it was first used on (e.g. across repeated asyncio.run() calls)
+        self._locks:typing.Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+        self._next_time = 0.0
+
+    def _get_lock(self) -> asyncio.Lock:
+
+        _loop = asyncio.get_running_loop()
+
+        _lock = self._locks.get(_loop)
+
+        if(_lock is None):
+
+            ## entries for loops that have since closed are unusable, drop them so the mapping doesn't grow
+            for _stale_loop in [_l for _l in self._locks if _l.is_closed()]:
+                del self._locks[_stale_loop]
+
+            _lock = asyncio.Lock()
+            self._locks[_loop] = _lock
+
+        return _lock
+
+    async def _acquire(self) -> None:
+
+        ## the reservation clock itself is monotonic and loop-agnostic, only the lock guarding it is per-loop
+        async with self._get_lock():
+            _now = time.monotonic()
+
+            ## idle time earns back up to burst-1 periods of headroom, clamping here is what caps the bucket
+            self._next_time = max(self._next_time, _now - (self._burst - 1) * self._period)
+
+            _wait = self._next_time - _now
+            self._next_time += self._period
+
+        if(_wait > 0):
+            await asyncio.sleep(_wait)
+
+##-------------------start-of-_apply_decorator()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+def _apply_decorator(decorator:typing.Callable, func:typing.Callable) -> typing.Callable:
+
+    """
+
+    Applies a user-supplied decorator to a translate function, sync or async.
+
+    Decorators written for plain functions often return the wrapped call's result without awaiting it; for coroutine functions the result is then an un-awaited coroutine. Wrapping the decorated callable so its result is awaited makes the same decorator work on both code paths.
+
+    Parameters:
+    decorator (callable) : The decorator to apply. Typically for exponential backoff retrying.
+    func (callable) : The function or coroutine function to decorate.
+
+    Returns:
+    decorated (callable) : The decorated callable, awaiting its result when func is a coroutine function.
+
+    """
+
+    _decorated = decorator(func)
+
+    if(not asyncio.iscoroutinefunction(func)):
+        return _decorated
+
+    async def _awaiting_wrapper(*args, **kwargs):
+        return await _decorated(*args, **kwargs)
+
+    return _awaiting_wrapper
 
 ##-------------------start-of-_string_to_bool()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'y', 't'})
+_NONE_STRINGS = frozenset({'none', 'null'})
+
 def _string_to_bool(string:str) -> bool:
 
-    return string.lower() in ['true', '1', 'yes', 'y', 't']
+    return string.lower() in _TRUE_STRINGS
 
 ##-------------------start-of-_convert_iterable_to_str()-------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -36,13 +135,17 @@ def _is_iterable_of_strings(value):
 
     if(isinstance(value, str)):
         return False
-    
+
+    ## fast path for the overwhelmingly common case, the per-element check is only worth paying for in debug builds (python -O skips it and trusts the API to reject non-strings)
+    if(isinstance(value, (list, tuple))):
+        return not __debug__ or all(isinstance(_item, str) for _item in value)
+
     try:
         _iterator = iter(value)
-        
+
     except TypeError:
         return False
-    
+
     return all(isinstance(_item, str) for _item in _iterator)
 
 ##-------------------start-of-_convert_to_correct_type()-------------------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -102,7 +205,7 @@ def _convert_to_correct_type(setting_name:str, initial_value:str) -> typing.Any:
     if("stream" in setting_name):
         _value = _string_to_bool(initial_value)
 
-    elif(isinstance(initial_value, str) and initial_value.lower() in ["none","null"]):
+    elif(isinstance(initial_value, str) and initial_value.lower() in _NONE_STRINGS):
         _value = None
 
     if(_setting_info["_type"] is None):
@@ -133,6 +236,46 @@ def _convert_to_correct_type(setting_name:str, initial_value:str) -> typing.Any:
 
     return _converted_value
 
+##-------------------start-of-_token_count()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _get_encoding(model:str):
+
+    """
+
+    Returns the tiktoken encoding for the given model, cached since the lookup builds the whole encoder.
+
+    Parameters:
+    model (string) : The model to get the encoding for.
+
+    Returns:
+    encoding (tiktoken.Encoding) : The encoding for the model.
+
+    """
+
+    ## deferred so importing easytl doesn't pay for loading tiktoken's encoder data, the lru_cache on this function means the import runs at most once per process anyway
+    import tiktoken
+
+    return tiktoken.encoding_for_model(model)
+
+@lru_cache(maxsize=4096)
+def _token_count(model:str, text:str) -> int:
+
+    """
+
+    Counts the tokens in the given text for the given model. Memoized, retry-heavy and batch-resubmit flows re-validate identical (model, text) pairs constantly.
+
+    Parameters:
+    model (string) : The model whose tokenizer to use.
+    text (string) : The text to count the tokens of.
+
+    Returns:
+    num_tokens (int) : The number of tokens in the text.
+
+    """
+
+    return len(_get_encoding(model).encode(text))
+
 ##-------------------start-of-_estimate_cost()---------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 
 def _estimate_cost(text:str | typing.Iterable, model:str, price_case:int | None = None) -> typing.Tuple[int, float, str]:
@@ -153,7 +296,9 @@ def _estimate_cost(text:str | typing.Iterable, model:str, price_case:int | None
 
     """
 
-    assert model in ALLOWED_OPENAI_MODELS + ALLOWED_GEMINI_MODELS + ALLOWED_ANTHROPIC_MODELS, f"""EasyTL does not support : {model}"""
+    ## an explicit raise instead of an assert, since asserts are stripped under python -O
+    if(model not in ALLOWED_OPENAI_MODELS + ALLOWED_GEMINI_MODELS + ALLOWED_ANTHROPIC_MODELS):
+        raise ValueError(f"""EasyTL does not support : {model}""")
 
     ## default models are first, then the rest are sorted by price case
     if(price_case is None):
@@ -316,20 +461,16 @@ def _estimate_cost(text:str | typing.Iterable, model:str, price_case:int | None
         _LLM_TYPE = next((model_type for model_type, allowed_models in model_types.items() if model in allowed_models))
 
         if(_LLM_TYPE == "openai"):
-            _encoding = tiktoken.encoding_for_model(model)
-            _num_tokens = len(_encoding.encode(text))
+            _num_tokens = _token_count(model, text)
 
         elif(_LLM_TYPE == "gemini"):
             ## no local option, and it seems to rate limit too lol, so we'll do it openai style
 
-                _encoding = tiktoken.encoding_for_model("gpt-4-turbo-0125")
-                _num_tokens = len(_encoding.encode(text))
+                _num_tokens = _token_count("gpt-4-turbo-0125", text)
 
         else:
             ## literally no way exists to get the number of tokens for anthropic, so we'll just use the gpt-4-turbo-0125 model as a stand-in
-            _encoding = tiktoken.encoding_for_model("gpt-4-turbo-0125")
-            _num_tokens = len(_encoding.encode(text))
-            pass
+            _num_tokens = _token_count("gpt-4-turbo-0125", text)
 
         _input_cost = _cost_details["_input_cost"]
         _output_cost = _cost_details["_output_cost"]